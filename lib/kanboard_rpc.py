@@ -0,0 +1,187 @@
+"""
+Kanboard JSON-RPC helpers.
+
+The stock kanboard client opens a new connection for every call and sends
+one call per HTTP request. SessionClient keeps connections alive through a
+shared requests.Session, and batch_call sends JSON-RPC 2.0 batch payloads
+(a JSON array of calls) so N+1 read patterns become one round-trip.
+Both use orjson for (de)serialization when it is installed.
+"""
+
+import base64
+import json
+from typing import Any
+
+import requests
+from kanboard import Client, ClientError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: faster (de)serialization of large task lists
+    orjson = None
+
+# Seconds to wait for a Kanboard response (single call or batch) before giving up
+DEFAULT_TIMEOUT = 30
+
+# Retry only failed connection attempts: JSON-RPC writes are not idempotent,
+# so a request that may have reached Kanboard is never re-sent
+CONNECT_RETRIES = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Calls per HTTP request; larger batches are split to keep payloads and
+# server-side execution time bounded on busy boards
+MAX_BATCH_SIZE = 100
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _auth_headers(kb_client: Any) -> dict[str, str]:
+    """Build request headers the way kanboard.Client.execute does.
+
+    The credentials go in the client's configured auth header (e.g.
+    X-API-Auth), with a "Basic " prefix only for the default Authorization.
+    """
+    auth_header = getattr(kb_client, "_auth_header", "Authorization")
+    credentials = base64.b64encode(
+        f"{kb_client._username}:{kb_client._password}".encode()
+    ).decode()
+    prefix = "Basic " if auth_header == "Authorization" else ""
+    headers = {**JSON_HEADERS, auth_header: prefix + credentials}
+    user_agent = getattr(kb_client, "_user_agent", None)
+    if user_agent:
+        headers["User-Agent"] = user_agent
+    return headers
+
+
+class SessionClient(Client):
+    """
+    kanboard.Client that reuses keep-alive connections.
+
+    Drop-in replacement for kanboard.Client: the dynamic snake_case API and
+    ClientError semantics are unchanged, only the transport differs.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=CONNECT_RETRIES
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+        self.session.verify = False if self._insecure else (self._cafile or True)
+
+    def _do_request(self, headers, body):
+        if self._ignore_hostname_verification and not self._insecure:
+            # requests cannot skip only the hostname check
+            return super()._do_request(headers, body)
+        try:
+            response = self.session.post(
+                self._url, headers=headers, data=_dumps(body), timeout=DEFAULT_TIMEOUT
+            )
+            response.raise_for_status()
+        except Exception as e:
+            raise ClientError(str(e))
+        return self._parse_response(response.content)
+
+    @staticmethod
+    def _parse_response(response: bytes):
+        if not response:
+            raise ClientError("Empty response from server")
+        try:
+            body = _loads(response)
+        except ValueError as e:
+            raise ClientError(f"Failed to parse JSON response: {e}")
+        if "error" in body:
+            raise ClientError(body.get("error").get("message"))
+        return body.get("result")
+
+
+class BatchCallError(Exception):
+    """Error returned by Kanboard for a single call inside a batch."""
+
+    def __init__(self, method: str, error: Any):
+        self.method = method
+        self.error = error
+        message = error.get("message") if isinstance(error, dict) else error
+        super().__init__(f"{method}: {message}")
+
+
+def batch_call(
+    kb_client: Any,
+    calls: list[tuple[str, dict]],
+    timeout: float = DEFAULT_TIMEOUT,
+    max_batch_size: int = MAX_BATCH_SIZE,
+) -> list[Any]:
+    """
+    Execute several JSON-RPC calls in a single HTTP request.
+
+    More than ``max_batch_size`` calls are sent as several batch requests.
+
+    Args:
+        kb_client: kanboard.Client instance (supplies URL and credentials;
+            a SessionClient also supplies its keep-alive session)
+        calls: List of (method, params) tuples, e.g. ("getTaskTags", {"task_id": 1})
+        timeout: Request timeout in seconds
+        max_batch_size: Maximum number of calls per HTTP request
+
+    Returns:
+        Results in the same order as ``calls``. Calls that failed on the
+        server are returned as BatchCallError instances instead of raising,
+        so one bad element does not discard the rest of the batch.
+
+    Raises:
+        requests.RequestException: On transport failure
+        ValueError: If the response is not a JSON-RPC batch response
+    """
+    if not calls:
+        return []
+    if len(calls) > max_batch_size:
+        results: list[Any] = []
+        for start in range(0, len(calls), max_batch_size):
+            results += batch_call(
+                kb_client, calls[start:start + max_batch_size], timeout, max_batch_size
+            )
+        return results
+
+    payload = [
+        {"jsonrpc": "2.0", "method": method, "id": index, "params": params}
+        for index, (method, params) in enumerate(calls)
+    ]
+    http = getattr(kb_client, "session", None) or requests
+    response = http.post(
+        kb_client._url,
+        data=_dumps(payload),
+        headers=_auth_headers(kb_client),
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    body = _loads(response.content)
+    if not isinstance(body, list):
+        raise ValueError(f"Expected JSON-RPC batch response, got: {str(body)[:200]}")
+
+    by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+    results = []
+    for index, (method, _params) in enumerate(calls):
+        item = by_id.get(index)
+        if item is None:
+            results.append(BatchCallError(method, "missing from batch response"))
+        elif item.get("error"):
+            results.append(BatchCallError(method, item["error"]))
+        else:
+            results.append(item.get("result"))
+    return results
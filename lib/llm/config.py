@@ -10,6 +10,9 @@ import yaml
 
 from .providers.registry import get_provider
 
+# libyaml's C loader parses several times faster; same safe-load semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class RoleConfig:
@@ -61,7 +64,7 @@ def load_config(path: str | Path) -> LLMConfig:
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
 
     if not data or "llm" not in data:
         raise ValueError("Configuration file missing 'llm' section")
@@ -96,7 +96,7 @@ def analyze_traces(workspace: Path | None = None, days: int = 7) -> TraceAnalysi
     # Analyze each trace
     for trace_file in trace_files:
         try:
-            with open(trace_file) as f:
+            with open(trace_file, encoding="utf-8") as f:
                 trace = json.load(f)
 
             # Track date range
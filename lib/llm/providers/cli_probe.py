@@ -0,0 +1,46 @@
+"""Cached health probes for CLI-backed providers."""
+
+import subprocess
+import time
+
+# Seconds a successful probe is trusted before the CLI is checked again
+CLI_PROBE_TTL = 300
+
+# argv -> monotonic expiry of the last successful probe
+_passed: dict[tuple[str, ...], float] = {}
+
+
+def cli_probe_passes(argv: list[str], timeout: int = 10) -> bool:
+    """Run a CLI health probe such as ``codex --version``.
+
+    Successful probes are remembered for CLI_PROBE_TTL seconds, so validating
+    several providers or clients backed by the same CLI spawns it once.
+    Failures are never cached: the user may install or log in and retry.
+
+    Args:
+        argv: Probe command line
+        timeout: Probe timeout in seconds
+
+    Returns:
+        True if the probe exited with status 0
+
+    Raises:
+        FileNotFoundError: If the command is not installed
+        subprocess.TimeoutExpired: If the probe exceeds ``timeout``
+    """
+    key = tuple(argv)
+    expires = _passed.get(key)
+    if expires is not None and expires > time.monotonic():
+        return True
+
+    result = subprocess.run(argv, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        _passed.pop(key, None)
+        return False
+    _passed[key] = time.monotonic() + CLI_PROBE_TTL
+    return True
+
+
+def clear_cli_probe_cache() -> None:
+    """Forget all successful probes (e.g. after reinstalling a CLI)."""
+    _passed.clear()
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from ..response import LLMRequest, LLMResponse
+from .cli_probe import cli_probe_passes
 
 
 class CodexCLIProvider:
@@ -27,13 +28,7 @@ class CodexCLIProvider:
         command = cfg.get("command") or os.getenv("CODEX_CMD", "codex")
 
         try:
-            version_result = subprocess.run(
-                [command, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if version_result.returncode != 0:
+            if not cli_probe_passes([command, "--version"], timeout=10):
                 raise ValueError(
                     f"Codex CLI command '{command}' failed version check."
                 )
@@ -47,13 +42,7 @@ class CodexCLIProvider:
             )
 
         # Validate login state because this provider relies on local auth.
-        login_result = subprocess.run(
-            [command, "login", "status"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if login_result.returncode != 0:
+        if not cli_probe_passes([command, "login", "status"], timeout=10):
             raise ValueError(
                 "Codex CLI is not logged in. Run 'codex login' first."
             )
@@ -116,6 +105,8 @@ class CodexCLIProvider:
                 input=stdin_input,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
                 timeout=timeout_s,
                 cwd=cwd,
             )
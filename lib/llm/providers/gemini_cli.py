@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from ..response import LLMRequest, LLMResponse
+from .cli_probe import cli_probe_passes
 
 
 class GeminiCLIProvider:
@@ -37,13 +38,7 @@ class GeminiCLIProvider:
 
         # Check if CLI is installed
         try:
-            version_result = subprocess.run(
-                [command, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if version_result.returncode != 0:
+            if not cli_probe_passes([command, "--version"], timeout=10):
                 raise ValueError(
                     f"Gemini CLI command '{command}' failed version check. "
                     "Install from https://github.com/google-gemini/gemini-cli"
@@ -112,7 +107,7 @@ class GeminiCLIProvider:
             stdin_input = None
         else:
             # Large prompt: pass via stdin
-            stdin_input = prompt.encode('utf-8')
+            stdin_input = prompt
 
         # Execute with timing
         request_id = str(uuid.uuid4())
@@ -124,6 +119,8 @@ class GeminiCLIProvider:
                 input=stdin_input,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
                 timeout=timeout_s,
                 cwd=cwd,
             )
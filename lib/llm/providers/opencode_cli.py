@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..response import LLMRequest, LLMResponse
+from .cli_probe import cli_probe_passes
 
 
 class OpenCodeCLIProvider:
@@ -37,13 +38,7 @@ class OpenCodeCLIProvider:
 
         # Check if CLI is installed
         try:
-            version_result = subprocess.run(
-                [command, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if version_result.returncode != 0:
+            if not cli_probe_passes([command, "--version"], timeout=10):
                 raise ValueError(
                     f"OpenCode CLI command '{command}' failed version check. "
                     "Install from https://github.com/opencodedev/opencode"
@@ -118,7 +113,7 @@ class OpenCodeCLIProvider:
             stdin_input = None
         else:
             # Large prompt: pass via stdin
-            stdin_input = prompt.encode('utf-8')
+            stdin_input = prompt
 
         # Execute with timing
         request_id = str(uuid.uuid4())
@@ -130,6 +125,8 @@ class OpenCodeCLIProvider:
                 input=stdin_input,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
                 timeout=timeout_s,
                 cwd=cwd,
             )
@@ -8,6 +8,22 @@ from typing import Any
 from .config import RoleConfig, ProviderConfig, compute_config_hash
 from .response import LLMRequest, LLMResponse
 
+try:
+    import orjson
+except ImportError:  # optional: faster serialization of large traces
+    orjson = None
+
+
+def _write_trace(trace_file: Path, trace_data: dict[str, Any]) -> None:
+    """Serialize a trace as indented UTF-8 JSON in a single write."""
+    if orjson is not None:
+        payload = orjson.dumps(
+            trace_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        payload = json.dumps(trace_data, indent=2).encode()
+    trace_file.write_bytes(payload)
+
 
 def record_trace(
     request: LLMRequest,
@@ -79,8 +95,7 @@ def record_trace(
 
     # Write trace file
     trace_file = trace_dir / f"{response.request_id}.json"
-    with open(trace_file, "w") as f:
-        json.dump(trace_data, f, indent=2)
+    _write_trace(trace_file, trace_data)
 
     return trace_file
 
@@ -157,7 +172,6 @@ def record_error_trace(
 
     # Write trace file
     trace_file = trace_dir / f"{request_id}.json"
-    with open(trace_file, "w") as f:
-        json.dump(trace_data, f, indent=2)
+    _write_trace(trace_file, trace_data)
 
     return trace_file
@@ -3,10 +3,13 @@ Structured Logging for AgentLeeOps.
 Outputs JSON-formatted logs for machine readability and observability.
 """
 
+import atexit
 import json
+import queue
 import sys
 import logging
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
 # Configure root logger
 logger = logging.getLogger("AgentLeeOps")
@@ -28,7 +31,7 @@ class JsonFormatter(logging.Formatter):
     def format(self, record):
         # Base fields
         log_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -49,6 +52,27 @@ class JsonFormatter(logging.Formatter):
 
 handler.setFormatter(JsonFormatter())
 
+_queue_listener = None
+
+
+def enable_queue_logging():
+    """
+    Format and write log records on a background thread.
+
+    Logging calls then only enqueue the record, so long-running processes
+    (the orchestrator's polling loop and agent workers) never block on the
+    stdout lock. Pending records are flushed at interpreter exit.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
 def get_logger(agent_name: str = "SYSTEM"):
     return AgentLogger(agent_name)
 
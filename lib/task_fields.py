@@ -7,6 +7,7 @@ This module provides unified access to task fields, supporting both:
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 # Schema for task fields with their defaults
@@ -20,6 +21,16 @@ FIELD_SCHEMA = {
 # Status fields managed by agents (not user-editable)
 STATUS_FIELDS = ["agent_status", "current_phase"]
 
+# Legacy YAML-style description fields, compiled once
+_DIRNAME_RE = re.compile(r'dirname:\s*(.+)')
+_CONTEXT_MODE_RE = re.compile(r'context_mode:\s*(.+)')
+_COMPLEXITY_RE = re.compile(r'complexity:\s*(.+)')
+_ACCEPTANCE_RE = re.compile(r'acceptance_criteria:\s*\|?\s*\n((?:[ \t]+.+\n?)+)', re.MULTILINE)
+_VALID_DIRNAME_RE = re.compile(r'^[a-z0-9][a-z0-9-]*$')
+
+# Parallel getTaskTags requests when a batch request is not possible
+TAG_FETCH_WORKERS = 8
+
 
 class TaskFieldError(Exception):
     """Raised when required task fields are missing or invalid."""
@@ -86,24 +97,39 @@ def update_status(kb_client: Any, task_id: int, **kwargs) -> bool:
     Returns:
         True if update succeeded, False otherwise
     """
-    # Filter to only valid status fields
-    valid_keys = {k: v for k, v in kwargs.items() if k in STATUS_FIELDS}
-    if not valid_keys:
+    calls = status_calls(task_id, **kwargs)
+    if not calls:
         return False
 
     try:
         # Save each metadata key individually
-        for key, value in valid_keys.items():
-            kb_client.save_task_metadata(
-                task_id=task_id,
-                name=key,
-                value=str(value)
-            )
+        for method, params in calls:
+            kb_client.execute(method, **params)
         return True
     except Exception:
         return False
 
 
+def status_calls(task_id: int, **kwargs) -> list:
+    """
+    Build the JSON-RPC calls that update_status() makes.
+
+    Lets callers fold status updates into a batch request.
+
+    Args:
+        task_id: Task ID to update
+        **kwargs: Status fields to update (agent_status, current_phase)
+
+    Returns:
+        List of (method, params) tuples; empty if no valid fields given
+    """
+    return [
+        ("saveTaskMetadata", {"task_id": task_id, "name": key, "value": str(value)})
+        for key, value in kwargs.items()
+        if key in STATUS_FIELDS
+    ]
+
+
 def get_status(kb_client: Any, task_id: int) -> dict:
     """
     Get agent status fields from task metadata.
@@ -146,12 +172,12 @@ def parse_yaml_description(description: str) -> dict:
         return data
 
     # Parse dirname
-    dirname_match = re.search(r'dirname:\s*(.+)', description)
+    dirname_match = _DIRNAME_RE.search(description)
     if dirname_match:
         data['dirname'] = dirname_match.group(1).strip()
 
     # Parse context_mode
-    mode_match = re.search(r'context_mode:\s*(.+)', description)
+    mode_match = _CONTEXT_MODE_RE.search(description)
     if mode_match:
         data['context_mode'] = mode_match.group(1).strip().upper()
     else:
@@ -159,11 +185,7 @@ def parse_yaml_description(description: str) -> dict:
 
     # Parse acceptance_criteria (multiline)
     # Look for "acceptance_criteria:" followed by a pipe or content
-    ac_match = re.search(
-        r'acceptance_criteria:\s*\|?\s*\n((?:[ \t]+.+\n?)+)',
-        description,
-        re.MULTILINE
-    )
+    ac_match = _ACCEPTANCE_RE.search(description)
     if ac_match:
         # Dedent the criteria
         criteria = ac_match.group(1)
@@ -186,7 +208,7 @@ def parse_yaml_description(description: str) -> dict:
         data['acceptance_criteria'] = ''
 
     # Parse complexity (optional)
-    complexity_match = re.search(r'complexity:\s*(.+)', description)
+    complexity_match = _COMPLEXITY_RE.search(description)
     if complexity_match:
         data['complexity'] = complexity_match.group(1).strip().upper()
     else:
@@ -212,7 +234,7 @@ def validate_task_fields(fields: dict) -> tuple:
     dirname = fields["dirname"]
 
     # Validate dirname format: lowercase, digits, dashes only, no leading dot
-    if not re.match(r'^[a-z0-9][a-z0-9-]*$', dirname):
+    if not _VALID_DIRNAME_RE.match(dirname):
         return False, (
             f"Invalid dirname '{dirname}': must be lowercase letters, "
             "digits, and dashes only, cannot start with dash"
@@ -250,7 +272,7 @@ def validate_task_fields(fields: dict) -> tuple:
 # --- Tag Helper Functions ---
 # Used by orchestrator and webhook_server for idempotency tracking
 
-def get_task_tags(kb_client: Any, task_id: int) -> list:
+def get_task_tags(kb_client: Any, task_id: int) -> frozenset:
     """
     Get tags for a task.
 
@@ -259,24 +281,72 @@ def get_task_tags(kb_client: Any, task_id: int) -> list:
         task_id: Task ID to fetch tags for
 
     Returns:
-        List of tag names (strings)
+        Frozenset of tag names (strings), for O(1) membership checks
     """
     try:
-        tags = kb_client.get_task_tags(task_id=task_id)
-        if not tags:
-            return []
-        if isinstance(tags, dict):
-            return [str(value) for value in tags.values()]
-        if isinstance(tags, list):
-            if tags and isinstance(tags[0], dict):
-                return [tag.get('name') for tag in tags if tag.get('name')]
-            return [str(tag) for tag in tags]
-        return []
+        return _normalize_tags(kb_client.get_task_tags(task_id=task_id))
     except Exception:
-        return []
+        return frozenset()
 
 
-def add_task_tag(kb_client: Any, project_id: int, task_id: int, tag_name: str) -> None:
+def get_task_tags_bulk(kb_client: Any, task_ids: list) -> dict:
+    """
+    Get tags for several tasks in one JSON-RPC batch request.
+
+    Falls back to concurrent get_task_tags calls, one per task, if the
+    batch request cannot be made.
+
+    Args:
+        kb_client: Kanboard client instance
+        task_ids: Task IDs to fetch tags for
+
+    Returns:
+        Dict mapping task ID (int) to frozenset of tag names
+    """
+    task_ids = [int(task_id) for task_id in task_ids]
+    if not task_ids:
+        return {}
+
+    try:
+        from lib.kanboard_rpc import batch_call
+
+        results = batch_call(
+            kb_client,
+            [("getTaskTags", {"task_id": task_id}) for task_id in task_ids],
+        )
+    except Exception:
+        # One request per task, overlapped on threads (each call waits on I/O)
+        workers = min(TAG_FETCH_WORKERS, len(task_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = pool.map(lambda task_id: get_task_tags(kb_client, task_id), task_ids)
+            return dict(zip(task_ids, fetched))
+
+    tags_by_id = {}
+    for task_id, raw in zip(task_ids, results):
+        tags_by_id[task_id] = frozenset() if isinstance(raw, Exception) else _normalize_tags(raw)
+    return tags_by_id
+
+
+def _normalize_tags(tags: Any) -> frozenset:
+    """Normalize the getTaskTags response shapes to a set of tag names."""
+    if not tags:
+        return frozenset()
+    if isinstance(tags, dict):
+        return frozenset(str(value) for value in tags.values())
+    if isinstance(tags, list):
+        if tags and isinstance(tags[0], dict):
+            return frozenset(tag.get('name') for tag in tags if tag.get('name'))
+        return frozenset(str(tag) for tag in tags)
+    return frozenset()
+
+
+def add_task_tag(
+    kb_client: Any,
+    project_id: int,
+    task_id: int,
+    tag_name: str,
+    known_tags: frozenset | None = None,
+) -> frozenset:
     """
     Add a tag to a task (creates tag if needed).
 
@@ -285,27 +355,36 @@ def add_task_tag(kb_client: Any, project_id: int, task_id: int, tag_name: str) -
         project_id: Project ID
         task_id: Task ID
         tag_name: Tag name to add
+        known_tags: Current task tags, if the caller just fetched them;
+            skips the getTaskTags round-trip
+
+    Returns:
+        Task tags after the update (unchanged if the update failed)
     """
+    existing = known_tags
     try:
         project_id = int(project_id)
         task_id = int(task_id)
-        existing = get_task_tags(kb_client, task_id)
+        if existing is None:
+            existing = get_task_tags(kb_client, task_id)
         if tag_name in existing:
-            return
-        updated = existing + [tag_name]
-        kb_client.set_task_tags(project_id=project_id, task_id=task_id, tags=updated)
+            return existing
+        updated = existing | {tag_name}
+        kb_client.set_task_tags(project_id=project_id, task_id=task_id, tags=sorted(updated))
+        return updated
     except Exception as e:
         from lib.logger import get_logger
         log = get_logger("TAGS")
         log.warning(f"Could not add tag '{tag_name}': {e}", task_id=task_id)
+        return frozenset(existing or ())
 
 
-def has_tag(tags: list, tag_name: str) -> bool:
+def has_tag(tags: frozenset, tag_name: str) -> bool:
     """
-    Check if a tag is in the tags list.
+    Check if a tag is in the tags collection.
 
     Args:
-        tags: List of tag names
+        tags: Tag names (frozenset from get_task_tags; any container works)
         tag_name: Tag name to check for
 
     Returns:
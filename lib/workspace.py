@@ -4,14 +4,31 @@ Handles creation and setup of project workspaces based on context mode.
 Enforces Ratchet Governance for file writes.
 """
 
+import stat
+import string
 import subprocess
 import os
 from pathlib import Path
 from lib.ratchet import check_write_permission
 
+# Root for all project workspaces (resolved once at import)
+_PROJECTS_ROOT = Path.home() / "projects"
+
+# Deleting every allowed character leaves "" only for valid dirnames
+_DIRNAME_DELETE_TABLE = str.maketrans('', '', string.ascii_lowercase + string.digits + '-')
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) unless a single stat shows it exists."""
+    try:
+        if stat.S_ISDIR(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        pass
+    os.makedirs(path, exist_ok=True)
+
 def get_workspace_path(dirname: str) -> Path:
     """Get the path to a workspace directory."""
-    return Path.home() / "projects" / dirname
+    return _PROJECTS_ROOT / dirname
 
 def safe_write_file(workspace: Path, relative_path: str, content: str, force: bool = False):
     """
@@ -33,8 +50,19 @@ def safe_write_file(workspace: Path, relative_path: str, content: str, force: bo
         if not check_write_permission(workspace, relative_path):
             raise PermissionError(f"RATCHET GUARD: {relative_path} is LOCKED. Cannot overwrite.")
 
-    full_path.parent.mkdir(parents=True, exist_ok=True)
-    full_path.write_text(content)
+    _ensure_dir(full_path.parent)
+    _write_bytes(full_path, content.encode("utf-8"))
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes with raw os.open/os.write, bypassing the text I/O stack."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 def setup_workspace(dirname: str, context_mode: str) -> Path:
     """
@@ -50,26 +78,26 @@ def setup_workspace(dirname: str, context_mode: str) -> Path:
     Raises:
         ValueError: If context_mode is invalid or FEATURE workspace doesn't exist
     """
-    path = Path.home() / "projects" / dirname
+    path = _PROJECTS_ROOT / dirname
 
     if context_mode == "NEW":
-        path.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(path)
 
         # Initialize git repo if not already initialized
-        git_dir = path / ".git"
-        if not git_dir.exists():
+        # (.git may be a file for worktrees/submodules, so test existence)
+        if not os.path.exists(os.path.join(path, ".git")):
             result = subprocess.run(
                 ["git", "init"],
                 cwd=path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True
             )
             if result.returncode != 0:
                 raise RuntimeError(f"Failed to init git repo: {result.stderr}")
         
         # Init Ratchet
-        ratchet_dir = path / ".agentleeops"
-        ratchet_dir.mkdir(exist_ok=True)
+        _ensure_dir(path / ".agentleeops")
 
         return path
 
@@ -104,7 +132,8 @@ def create_feature_branch(workspace: Path, task_id: str, dirname: str) -> str:
     result = subprocess.run(
         ["git", "checkout", "-b", branch_name],
         cwd=workspace,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True
     )
 
@@ -113,7 +142,8 @@ def create_feature_branch(workspace: Path, task_id: str, dirname: str) -> str:
         result = subprocess.run(
             ["git", "checkout", branch_name],
             cwd=workspace,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         if result.returncode != 0:
@@ -134,8 +164,6 @@ def validate_dirname(dirname: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
-
     if not dirname:
         return False
 
@@ -144,7 +172,7 @@ def validate_dirname(dirname: str) -> bool:
         return False
 
     # Must only contain lowercase letters, digits, and dashes
-    if not re.match(r'^[a-z0-9-]+$', dirname):
+    if dirname.translate(_DIRNAME_DELETE_TABLE):
         return False
 
     return True
\ No newline at end of file
@@ -6,30 +6,74 @@ Watches Kanboard columns and triggers appropriate agents.
 Supports both polling mode and single-run mode (--once).
 
 Usage:
-    python orchestrator.py          # Polling mode (runs continuously)
-    python orchestrator.py --once   # Single-run mode (process one card, exit)
+    python orchestrator.py                      # Polling mode (runs continuously)
+    python orchestrator.py --webhook-port 5001  # Webhook push + slow reconciliation polling
+    python orchestrator.py --once               # Single-run mode (process one card, exit)
 """
 
 import argparse
+import contextlib
+import functools
+import hmac
+import json
 import os
+import random
 import re
+import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, urlparse
 
 from dotenv import load_dotenv
-from kanboard import Client
 
-from lib.task_fields import get_task_fields, update_status, TaskFieldError, get_task_tags, add_task_tag, has_tag
+try:
+    import fcntl
+except ImportError:  # not on Windows; the in-process _IN_FLIGHT guard still applies
+    fcntl = None
+
+from agents.architect import run_architect_agent
+from agents.code_review import run_code_review_agent
+from agents.governance import run_governance_agent
+from agents.pm import run_pm_agent
+from agents.ralph import run_ralph_agent
+from agents.spawner import run_spawner_agent
+from agents.test_agent import run_test_agent
+from agents.test_code_agent import run_test_code_agent
+from lib.kanboard_rpc import BatchCallError, SessionClient, batch_call
+from lib.logger import enable_queue_logging, get_logger
+from lib.task_fields import (
+    get_task_fields,
+    update_status,
+    TaskFieldError,
+    get_task_tags,
+    get_task_tags_bulk,
+    add_task_tag,
+    has_tag,
+    status_calls,
+)
 from lib.workpackage import KanboardLifecycleAdapter
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from the .env file next to this script (if any).
+# An explicit path skips find_dotenv's stack inspection and directory walk;
+# variables already exported in the environment still take precedence.
+_DOTENV_PATH = Path(__file__).resolve().with_name(".env")
+if _DOTENV_PATH.is_file():
+    load_dotenv(_DOTENV_PATH)
 
 # --- CONFIGURATION ---
 KB_URL = os.getenv("KANBOARD_URL", "http://localhost:88/jsonrpc.php")
 KB_USER = os.getenv("KANBOARD_USER", "jsonrpc")
 KB_TOKEN = os.getenv("KANBOARD_TOKEN")
+# Optional: must match the ?token= query parameter on incoming webhooks
+WEBHOOK_TOKEN = os.getenv("KANBOARD_WEBHOOK_TOKEN")
+# Interface the webhook listener binds to (localhost unless Kanboard runs elsewhere)
+WEBHOOK_HOST = os.getenv("AGENTLEEOPS_WEBHOOK_HOST", "127.0.0.1")
 
 # Column triggers (Must match your board EXACTLY)
 # Updated to match Product Definition v1.1 (Context-Reset TDD)
@@ -44,6 +88,34 @@ TRIGGERS = {
     "9. Code Review": "CODE_REVIEW_AGENT",
 }
 
+# Upper bound (seconds) for the idle backoff in polling mode
+MAX_POLL_INTERVAL = 60
+
+# Pause (seconds) between passes while draining, so a handler that reports
+# work without moving its card cannot make the loop hammer Kanboard
+DRAIN_INTERVAL = 1
+
+# Polling interval used for reconciliation when webhooks deliver the events
+WEBHOOK_RECONCILE_INTERVAL = 300
+
+# Kanboard webhook events that can move a card into a trigger column
+WEBHOOK_EVENTS = {"task.move.column", "task.create"}
+
+# Seconds a fetched column map stays valid (columns rarely change)
+COLUMN_CACHE_TTL = 300
+
+# Seconds task fields stay cached for an unmodified card
+TASK_FIELDS_CACHE_TTL = 300
+
+# Seconds a card seen with its completed tag is skipped without re-reading tags
+COMPLETED_CACHE_TTL = 300
+
+# Per-task lock files shared by orchestrator processes on this host
+CLAIMS_DIR = Path.home() / ".agentleeops" / "claims"
+
+# Set to wake an idle polling loop early (see run_polling)
+_WAKE_EVENT = threading.Event()
+
 # Tags for state tracking
 TAGS = {
     "ARCHITECT_AGENT": {
@@ -87,6 +159,11 @@ TAGS = {
     },
 }
 
+# Per-action tag names, flattened once for the polling hot path
+_STARTED_TAG = {action: tags["started"] for action, tags in TAGS.items()}
+_COMPLETED_TAG = {action: tags["completed"] for action, tags in TAGS.items()}
+_FAILED_TAG = {action: tags.get("failed") for action, tags in TAGS.items()}
+
 
 def connect_kb():
     """Connect to Kanboard API."""
@@ -95,14 +172,12 @@ def connect_kb():
         sys.exit(1)
 
     try:
-        return Client(KB_URL, KB_USER, KB_TOKEN)
+        return SessionClient(KB_URL, KB_USER, KB_TOKEN)
     except Exception as e:
         print(f"Connection Failed: {e}")
         sys.exit(1)
 
 
-from lib.logger import get_logger
-
 log = get_logger("ORCHESTRATOR")
 
 SINGLE_CARD_MODE = os.getenv("AGENTLEEOPS_SINGLE_CARD_MODE", "0").strip().lower() in {
@@ -113,6 +188,17 @@ SINGLE_CARD_MODE = os.getenv("AGENTLEEOPS_SINGLE_CARD_MODE", "0").strip().lower(
 }
 _SINGLE_CARD_ADAPTER: KanboardLifecycleAdapter | None = None
 
+# Worker threads for polling passes. Defaults to 1 (sequential) because atomic
+# child cards share their parent's workspace; raise it for independent cards.
+MAX_CONCURRENCY = max(1, int(os.getenv("AGENTLEEOPS_CONCURRENCY", "1")))
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="agent")
+_IN_FLIGHT: set[int] = set()
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# (task_id, action) -> monotonic expiry for cards already seen as completed
+_COMPLETED_SEEN: dict[tuple[int, str], float] = {}
+_COMPLETED_LOCK = threading.Lock()
+
 
 NORMALIZED_TRIGGER_MAP = {
     "design draft": "ARCHITECT_AGENT",
@@ -139,6 +225,52 @@ def resolve_trigger_action(column_title: str) -> str | None:
     return NORMALIZED_TRIGGER_MAP.get(_normalize_column_title(column_title))
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_column_maps(kb, project_id: int, epoch: int) -> tuple[dict, dict, dict]:
+    cols = kb.get_columns(project_id=project_id)
+    col_map = {c['title']: c['id'] for c in cols}
+    col_id_to_name = {c['id']: c['title'] for c in cols}
+    return col_map, col_id_to_name, _trigger_actions_by_column(col_id_to_name)
+
+
+def get_column_maps(kb, project_id: int) -> tuple[dict, dict]:
+    """
+    Get (title -> id, id -> title) column maps for a project.
+
+    Results are cached for COLUMN_CACHE_TTL seconds so polling passes and
+    agent chains do not re-fetch the column list on every call.
+    """
+    epoch = int(time.time() // COLUMN_CACHE_TTL)
+    col_map, col_id_to_name, _ = _cached_column_maps(kb, int(project_id), epoch)
+    return col_map, col_id_to_name
+
+
+def get_trigger_actions(kb, project_id: int) -> dict:
+    """Get the column id -> trigger action map, cached with the column maps."""
+    epoch = int(time.time() // COLUMN_CACHE_TTL)
+    return _cached_column_maps(kb, int(project_id), epoch)[2]
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_task_fields(kb, task_id: int, fingerprint: str, epoch: int) -> dict:
+    return get_task_fields(kb, task_id)
+
+
+def get_task_fields_cached(kb, task: dict) -> dict:
+    """
+    get_task_fields() memoized on the task's date_modification.
+
+    Cards that sit in a trigger column across many passes skip the
+    metadata fetch until they are edited, or for at most
+    TASK_FIELDS_CACHE_TTL seconds. Field errors are never cached.
+    """
+    fingerprint = task.get('date_modification')
+    if not fingerprint:
+        return get_task_fields(kb, task['id'])
+    epoch = int(time.time() // TASK_FIELDS_CACHE_TTL)
+    return dict(_cached_task_fields(kb, int(task['id']), str(fingerprint), epoch))
+
+
 def _get_single_card_adapter() -> KanboardLifecycleAdapter:
     global _SINGLE_CARD_ADAPTER
     if _SINGLE_CARD_ADAPTER is None:
@@ -157,7 +289,7 @@ def _sync_single_card_state(
 
     task_id = int(task["id"])
     try:
-        fields = get_task_fields(kb, task_id)
+        fields = get_task_fields_cached(kb, task)
     except TaskFieldError as err:
         log.warning(f"Single-card sync skipped: {err}", task_id=task_id)
         return None
@@ -184,46 +316,82 @@ def _sync_single_card_state(
     return work_package_dir
 
 
-def _replace_task_tags(kb, project_id: int, task_id: int, tags: list[str]) -> None:
-    """Replace task tags with deduped values."""
+def _dedupe_tags(tags: list[str]) -> list[str]:
+    """Drop empty and repeated tags, keeping first-seen order."""
     seen = set()
     ordered = []
     for tag in tags:
         if tag and tag not in seen:
             seen.add(tag)
             ordered.append(tag)
-    kb.set_task_tags(project_id=int(project_id), task_id=int(task_id), tags=ordered)
+    return ordered
 
 
-def _remove_task_tag(kb, project_id: int, task_id: int, tag_name: str) -> None:
-    """Remove a tag from a task if present."""
-    tags = get_task_tags(kb, task_id)
+def _replace_task_tags(kb, project_id: int, task_id: int, tags: list[str]) -> None:
+    """Replace task tags with deduped values."""
+    kb.set_task_tags(project_id=int(project_id), task_id=int(task_id), tags=_dedupe_tags(tags))
+
+
+def _remove_task_tag(
+    kb,
+    project_id: int,
+    task_id: int,
+    tag_name: str,
+    tags: frozenset | None = None,
+) -> frozenset:
+    """
+    Remove a tag from a task if present.
+
+    Args:
+        tags: Current task tags, if the caller already has them
+
+    Returns:
+        Task tags after the removal
+    """
+    if tags is None:
+        tags = get_task_tags(kb, task_id)
     if tag_name not in tags:
-        return
-    _replace_task_tags(kb, project_id, task_id, [t for t in tags if t != tag_name])
+        return tags
+    remaining = tags - {tag_name}
+    _replace_task_tags(kb, project_id, task_id, sorted(remaining))
+    return remaining
 
 
-def _clear_stale_started(kb, project_id: int, task_id: int, agent_tags: dict[str, str]) -> None:
+def _clear_stale_started(
+    kb,
+    project_id: int,
+    task_id: int,
+    agent_tags: dict[str, str],
+    tags: frozenset | None = None,
+) -> frozenset:
     """
     Unblock retries when a task was previously marked failed but still has a started tag.
+
+    Args:
+        tags: Current task tags, if the caller already has them (e.g. from
+            the batched fetch in a polling pass)
+
+    Returns:
+        Task tags after the cleanup, so callers need not re-read them
     """
+    if tags is None:
+        tags = get_task_tags(kb, task_id)
     failed_tag = agent_tags.get("failed")
     started_tag = agent_tags.get("started")
-    if not failed_tag or not started_tag:
-        return
-    tags = get_task_tags(kb, task_id)
-    if failed_tag in tags and started_tag in tags:
-        _remove_task_tag(kb, project_id, task_id, started_tag)
+    if failed_tag and started_tag and failed_tag in tags and started_tag in tags:
+        return _remove_task_tag(kb, project_id, task_id, started_tag, tags=tags)
+    return tags
 
 
 def _mark_agent_failed(kb, project_id: int, task_id: int, agent_tags: dict[str, str]) -> None:
     """Mark failed state and remove started tag so retries are possible."""
     started_tag = agent_tags.get("started")
     failed_tag = agent_tags.get("failed")
+    tags = None
     if started_tag:
-        _remove_task_tag(kb, project_id, task_id, started_tag)
+        tags = _remove_task_tag(kb, project_id, task_id, started_tag)
     if failed_tag:
-        add_task_tag(kb, project_id, task_id, failed_tag)
+        add_task_tag(kb, project_id, task_id, failed_tag, known_tags=tags)
 
 
 def _mark_agent_succeeded(kb, project_id: int, task_id: int, agent_tags: dict[str, str]) -> None:
@@ -233,167 +401,293 @@ def _mark_agent_succeeded(kb, project_id: int, task_id: int, agent_tags: dict[st
     if failed_tag:
         _remove_task_tag(kb, project_id, task_id, failed_tag)
 
-def process_architect_task(kb, task: dict, project_id: int) -> bool:
-    """
-    Process a task in the Design Draft column.
 
-    Returns:
-        True if task was processed, False otherwise
+def _complete_agent_run(
+    kb,
+    project_id: int,
+    task_id: int,
+    agent_tags: dict[str, str],
+    phase: str | None = None,
+    comment: str | None = None,
+) -> None:
     """
-    from agents.architect import run_architect_agent
-
-    task_id = task['id']
-    title = task['title']
-    desc = task.get('description', '')
-
-    # Check if already processed
-    tags = get_task_tags(kb, task_id)
-    agent_tags = TAGS["ARCHITECT_AGENT"]
-    _clear_stale_started(kb, project_id, task_id, agent_tags)
-    tags = get_task_tags(kb, task_id)
-
-    if has_tag(tags, agent_tags["completed"]):
-        log.info("Task already processed", task_id=task_id)
-        return False
-
-    if has_tag(tags, agent_tags["started"]):
-        log.info("Task already in progress", task_id=task_id)
-        return False
+    Record a successful agent run in a single JSON-RPC batch.
+
+    Equivalent to _mark_agent_succeeded + update_status(completed) +
+    create_comment, but sends the writes in one HTTP request. Calls that
+    Kanboard rejects are retried one by one. If the batch request itself
+    fails, only the idempotent tag and status writes are re-sent: the batch
+    may have been applied with just its response lost, and re-posting the
+    comment would duplicate it.
+    """
+    failed_tag = agent_tags.get("failed")
+    tags = sorted((get_task_tags(kb, task_id) - {failed_tag}) | {agent_tags["completed"]})
+    calls = [
+        ("setTaskTags", {"project_id": int(project_id), "task_id": int(task_id), "tags": _dedupe_tags(tags)}),
+    ]
+    if phase:
+        calls += status_calls(task_id, agent_status="completed", current_phase=phase)
+    if comment:
+        calls.append(("createComment", {"task_id": task_id, "user_id": 1, "content": comment}))
 
-    # Get task fields (metadata API or YAML fallback)
     try:
-        fields = get_task_fields(kb, task_id)
-        dirname = fields["dirname"]
-        context_mode = fields.get("context_mode", "NEW")
-        acceptance_criteria = fields.get("acceptance_criteria", "")
-    except TaskFieldError as e:
-        log.error(f"Field error: {e}", task_id=task_id)
-        kb.create_comment(
-            task_id=task_id,
-            user_id=1,
-            content=f"**ARCHITECT_AGENT Error**\n\n{e}"
-        )
-        return False
+        results = batch_call(kb, calls)
+    except Exception as e:
+        log.warning(f"Batch update failed, re-sending tag and status writes: {e}", task_id=task_id)
+        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
+        if phase:
+            update_status(kb, task_id, agent_status="completed", current_phase=phase)
+        if comment:
+            log.warning("Completion comment not re-posted; it may be missing", task_id=task_id)
+        return
 
-    log.info(f"Processing Architect: {title}", task_id=task_id, dirname=dirname)
+    for (method, params), result in zip(calls, results):
+        if not isinstance(result, BatchCallError):
+            continue
+        # Kanboard rejected this call, so it was not applied: safe to re-send
+        log.warning(f"Batch call failed, retrying individually: {result}", task_id=task_id)
+        try:
+            kb.execute(method, **params)
+        except Exception as e:
+            log.error(f"Retry of {method} failed: {e}", task_id=task_id)
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """How the generic runner drives one artifact-producing agent."""
+
+    action: str
+    runner: Callable[..., dict]
+    phase: str
+    label: str
+    # Forward context_mode/acceptance_criteria from the task fields
+    needs_context: bool = False
+    # Comment on the card when its fields cannot be read
+    comment_field_errors: bool = False
+    # Success log line and optional card comment, built from the agent result
+    success_log: Callable[[dict], str] = lambda result: "Success"
+    success_comment: Callable[[dict], str] | None = None
+    # Comment heading for failures (no comment if None)
+    failure_heading: str | None = None
+    # Tag that must be present before the agent may run, and the comment
+    # posted (as a failure) when it is missing
+    requires_tag: str | None = None
+    missing_requirement_comment: str = ""
+    # Extra success check on the agent result, and the failure comment
+    # posted when it does not pass
+    gate: Callable[[dict], bool] | None = None
+    gate_failed_comment: str = ""
+
+
+_AGENT_SPECS = {
+    "ARCHITECT_AGENT": AgentSpec(
+        action="ARCHITECT_AGENT",
+        runner=run_architect_agent,
+        phase="design",
+        label="Architect",
+        needs_context=True,
+        comment_field_errors=True,
+        success_log=lambda result: "Success: DESIGN.md written",
+    ),
+    "PM_AGENT": AgentSpec(
+        action="PM_AGENT",
+        runner=run_pm_agent,
+        phase="planning",
+        label="PM",
+        needs_context=True,
+        comment_field_errors=True,
+        success_log=lambda result: "Success: prd.json written",
+        failure_heading="PM_AGENT Failed",
+    ),
+    "TEST_AGENT": AgentSpec(
+        action="TEST_AGENT",
+        runner=run_test_agent,
+        phase="tests",
+        label="Test Generation",
+        success_log=lambda result: f"Success: Created {result.get('test_plan', 'test plan')}",
+        success_comment=lambda result: (
+            f"**TEST_AGENT**: Created test plan `{result.get('test_plan', 'test plan')}`."
+            "\n\nReady for Human Review."
+        ),
+        failure_heading="TEST_AGENT Failed",
+    ),
+    "RALPH_CODER": AgentSpec(
+        action="RALPH_CODER",
+        runner=run_ralph_agent,
+        phase="coding",
+        label="Ralph Loop",
+        success_log=lambda result: f"Success: Green Bar in {result['iterations']} iterations",
+        success_comment=lambda result: (
+            f"**RALPH**: Tests passed in {result['iterations']} iterations. Code committed."
+        ),
+        failure_heading="RALPH Failed",
+    ),
+    "CODE_REVIEW_AGENT": AgentSpec(
+        action="CODE_REVIEW_AGENT",
+        runner=run_code_review_agent,
+        phase="review",
+        label="Code Review",
+        success_log=lambda result: (
+            f"Code review completed: {result.get('overall_status')}, "
+            f"{result.get('finding_count')} findings"
+        ),
+        failure_heading="CODE_REVIEW_AGENT Failed",
+        requires_tag=TAGS["RALPH_CODER"]["completed"],
+        missing_requirement_comment=(
+            "**CODE_REVIEW_AGENT Failed**\n\nMissing `coding-complete` tag. "
+            "Complete Ralph loop before code review."
+        ),
+        gate=lambda result: result.get("gate_passed", False),
+        gate_failed_comment=(
+            "**CODE_REVIEW_AGENT Gate Failed**\n\nReview status is FAIL. "
+            "See `reviews/CODE_REVIEW_NEXT_STEPS.md`."
+        ),
+    ),
+}
 
-    # Mark as started (tag + metadata)
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
-    update_status(kb, task_id, agent_status="running", current_phase="design")
 
-    # Run architect agent
-    result = run_architect_agent(
-        task_id=str(task_id),
-        title=title,
-        dirname=dirname,
-        context_mode=context_mode,
-        acceptance_criteria=acceptance_criteria,
-        kb_client=kb,
-        project_id=project_id
-    )
-
-    if result["success"]:
-        # Mark as completed (tag + metadata)
-        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="completed", current_phase="design")
-        log.info(f"Success: DESIGN.md written", task_id=task_id)
-        return True
-    else:
-        _mark_agent_failed(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="failed", current_phase="design")
-        log.error(f"Failed: {result['error']}", task_id=task_id)
-        return False
+def _record_agent_failure(
+    kb,
+    project_id: int,
+    task_id: int,
+    agent_tags: dict[str, str],
+    phase: str,
+    comment: str | None = None,
+) -> None:
+    """Tag and mark a task failed for a phase, optionally explaining why."""
+    _mark_agent_failed(kb, project_id, task_id, agent_tags)
+    update_status(kb, task_id, agent_status="failed", current_phase=phase)
+    if comment:
+        kb.create_comment(task_id=task_id, user_id=1, content=comment)
 
 
-def process_pm_task(kb, task: dict, project_id: int) -> bool:
-    """
-    Process a task in the Planning Draft column.
+def _run_agent_task(kb, task: dict, project_id: int, spec: AgentSpec) -> bool:
     """
-    from agents.pm import run_pm_agent
+    Run an artifact-producing agent for a task in its trigger column.
 
+    Shared by every agent in _AGENT_SPECS: skip completed or in-progress
+    tasks, read the task fields, mark started, run the agent, then record
+    success or failure.
+
+    Returns:
+        True if task was processed, False otherwise
+    """
     task_id = task['id']
     title = task['title']
+    agent_tags = TAGS[spec.action]
 
     # Check if already processed
-    tags = get_task_tags(kb, task_id)
-    agent_tags = TAGS["PM_AGENT"]
-    _clear_stale_started(kb, project_id, task_id, agent_tags)
-    tags = get_task_tags(kb, task_id)
+    tags = _clear_stale_started(kb, project_id, task_id, agent_tags)
 
     if has_tag(tags, agent_tags["completed"]):
-        log.info("PM Task already processed", task_id=task_id)
+        log.info("Task already processed", task_id=task_id, action=spec.action)
         return False
 
     if has_tag(tags, agent_tags["started"]):
-        log.info("PM Task already in progress", task_id=task_id)
+        log.info("Task already in progress", task_id=task_id, action=spec.action)
         return False
 
-    # Get task fields
+    if spec.requires_tag and spec.requires_tag not in tags:
+        log.warning(f"Missing required tag {spec.requires_tag}", task_id=task_id, action=spec.action)
+        _record_agent_failure(
+            kb, project_id, task_id, agent_tags, spec.phase, spec.missing_requirement_comment
+        )
+        return False
+
+    # Get task fields (metadata API or YAML fallback)
     try:
-        fields = get_task_fields(kb, task_id)
+        fields = get_task_fields_cached(kb, task)
         dirname = fields["dirname"]
-        context_mode = fields.get("context_mode", "NEW")
-        acceptance_criteria = fields.get("acceptance_criteria", "")
     except TaskFieldError as e:
-        log.error(f"PM Error: {e}", task_id=task_id)
-        kb.create_comment(task_id=task_id, content=f"**PM_AGENT Error**\n\n{e}")
+        log.error(f"Field error: {e}", task_id=task_id, action=spec.action)
+        if spec.comment_field_errors:
+            kb.create_comment(
+                task_id=task_id,
+                user_id=1,
+                content=f"**{spec.action} Error**\n\n{e}"
+            )
         return False
 
-    log.info(f"Processing PM: {title}", task_id=task_id)
+    kwargs = {}
+    if spec.needs_context:
+        kwargs["context_mode"] = fields.get("context_mode", "NEW")
+        kwargs["acceptance_criteria"] = fields.get("acceptance_criteria", "")
 
-    # Mark as started
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
-    update_status(kb, task_id, agent_status="running", current_phase="planning")
+    log.info(f"Processing {spec.label}: {title}", task_id=task_id, dirname=dirname)
 
-    # Run PM agent
-    result = run_pm_agent(
+    # Mark as started (tag + metadata)
+    tags = add_task_tag(kb, project_id, task_id, agent_tags["started"], known_tags=tags)
+    update_status(kb, task_id, agent_status="running", current_phase=spec.phase)
+
+    result = spec.runner(
         task_id=str(task_id),
         title=title,
         dirname=dirname,
-        context_mode=context_mode,
-        acceptance_criteria=acceptance_criteria,
         kb_client=kb,
-        project_id=project_id
+        project_id=project_id,
+        **kwargs
     )
 
     if result["success"]:
-        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="completed", current_phase="planning")
-        log.info(f"Success: prd.json written", task_id=task_id)
+        if spec.gate and not spec.gate(result):
+            log.error(f"{spec.label} gate failed", task_id=task_id)
+            _record_agent_failure(
+                kb, project_id, task_id, agent_tags, spec.phase, spec.gate_failed_comment
+            )
+            return False
+        log.info(spec.success_log(result), task_id=task_id)
+        _complete_agent_run(
+            kb, project_id, task_id, agent_tags, phase=spec.phase,
+            comment=spec.success_comment(result) if spec.success_comment else None,
+        )
         return True
-    else:
-        _mark_agent_failed(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="failed", current_phase="planning")
-        log.error(f"PM Failed: {result['error']}", task_id=task_id)
-        kb.create_comment(task_id=task_id, content=f"**PM_AGENT Failed**\n\n{result['error']}")
-        return False
+
+    log.error(f"{spec.label} Failed: {result['error']}", task_id=task_id)
+    _record_agent_failure(
+        kb, project_id, task_id, agent_tags, spec.phase,
+        f"**{spec.failure_heading}**\n\n{result['error']}" if spec.failure_heading else None,
+    )
+    return False
 
 
-def process_governance_task(kb, task: dict, project_id: int) -> bool:
+def process_governance_task(
+    kb,
+    task: dict,
+    project_id: int,
+    tags: frozenset | None = None,
+) -> bool:
     """
     Process a task in an Approved column (Locking).
-    """
-    from agents.governance import run_governance_agent
 
+    Args:
+        tags: Current task tags, if the caller already has them; skips a
+            getTaskTags round-trip.
+    """
     task_id = task['id']
     title = task['title']
-    
-    try:
-        task_details = kb.get_task(task_id=task_id)
-        col_id = task_details['column_id']
-        cols = kb.get_columns(project_id=project_id)
-        col_title = next((c['title'] for c in cols if c['id'] == int(col_id)), "")
-    except Exception:
-        return False
 
-    tags = get_task_tags(kb, task_id)
+    if tags is None:
+        tags = get_task_tags(kb, task_id)
     agent_tags = TAGS["GOVERNANCE_AGENT"]
 
     if has_tag(tags, agent_tags["completed"]):
         return False
 
     try:
-        fields = get_task_fields(kb, task_id)
+        # The polled task already carries its column; only re-fetch if it doesn't
+        col_id = task.get('column_id')
+        if col_id is None:
+            col_id = kb.get_task(task_id=task_id)['column_id']
+        _, col_id_to_name = get_column_maps(kb, project_id)
+        col_title = next(
+            (title for cid, title in col_id_to_name.items() if int(cid) == int(col_id)),
+            "",
+        )
+    except Exception:
+        return False
+
+    try:
+        fields = get_task_fields_cached(kb, task)
         dirname = fields["dirname"]
     except TaskFieldError:
         return False
@@ -401,7 +695,7 @@ def process_governance_task(kb, task: dict, project_id: int) -> bool:
     log.info(f"Processing Governance for: {title}", task_id=task_id)
     
     # No started tag needed for instant locking usually, but good for tracing
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
+    tags = add_task_tag(kb, project_id, task_id, agent_tags["started"], known_tags=tags)
     
     result = run_governance_agent(
         task_id=str(task_id),
@@ -422,16 +716,13 @@ def process_spawner_task(kb, task: dict, project_id: int) -> bool:
     """
     Process a task in the Plan Approved column (Fan-Out).
     """
-    from agents.spawner import run_spawner_agent
-    
     # 1. Enforce Governance First
-    tags = get_task_tags(kb, task['id'])
-    _clear_stale_started(kb, project_id, task['id'], TAGS["SPAWNER_AGENT"])
-    tags = get_task_tags(kb, task['id'])
+    tags = _clear_stale_started(kb, project_id, task['id'], TAGS["SPAWNER_AGENT"])
     if not has_tag(tags, TAGS["GOVERNANCE_AGENT"]["completed"]):
         log.info("Chaining Governance before Spawning...", task_id=task['id'])
-        process_governance_task(kb, task, project_id)
-        tags = get_task_tags(kb, task['id'])
+        # Only re-read tags if governance actually changed them
+        if process_governance_task(kb, task, project_id, tags=tags):
+            tags = get_task_tags(kb, task['id'])
     
     task_id = task['id']
     title = task['title']
@@ -443,7 +734,7 @@ def process_spawner_task(kb, task: dict, project_id: int) -> bool:
             return False
         if has_tag(tags, agent_tags["started"]):
             return False
-        add_task_tag(kb, project_id, task_id, agent_tags["started"])
+        tags = add_task_tag(kb, project_id, task_id, agent_tags["started"], known_tags=tags)
         _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
         kb.create_comment(
             task_id=task_id,
@@ -466,14 +757,14 @@ def process_spawner_task(kb, task: dict, project_id: int) -> bool:
     
     # Get fields for dirname
     try:
-        fields = get_task_fields(kb, task_id)
+        fields = get_task_fields_cached(kb, task)
         dirname = fields["dirname"]
     except TaskFieldError:
         return False
 
     log.info(f"Processing Spawner for: {title}", task_id=task_id)
     
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
+    tags = add_task_tag(kb, project_id, task_id, agent_tags["started"], known_tags=tags)
     # No status update needed? Or maybe "spawning"
     
     result = run_spawner_agent(
@@ -485,9 +776,11 @@ def process_spawner_task(kb, task: dict, project_id: int) -> bool:
     )
 
     if result["success"]:
-        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
         log.info(f"Success: Spawned {result.get('count')} child cards", task_id=task_id)
-        kb.create_comment(task_id=task_id, user_id=1, content=f"**SPAWNER**: Automatically created {result.get('count')} child tasks in 'Tests Draft'.")
+        _complete_agent_run(
+            kb, project_id, task_id, agent_tags,
+            comment=f"**SPAWNER**: Automatically created {result.get('count')} child tasks in 'Tests Draft'.",
+        )
         return True
     else:
         _mark_agent_failed(kb, project_id, task_id, agent_tags)
@@ -496,72 +789,44 @@ def process_spawner_task(kb, task: dict, project_id: int) -> bool:
         return False
 
 
-def process_test_task(kb, task: dict, project_id: int) -> bool:
+def _move_and_fetch_children(kb, child_ids: list[int], dest_col_id: int | None) -> list:
     """
-    Process a task in the Tests Draft column.
-    """
-    from agents.test_agent import run_test_agent
-
-    task_id = task['id']
-    title = task['title']
-
-    tags = get_task_tags(kb, task_id)
-    agent_tags = TAGS["TEST_AGENT"]
-    _clear_stale_started(kb, project_id, task_id, agent_tags)
-    tags = get_task_tags(kb, task_id)
-
-    if has_tag(tags, agent_tags["completed"]):
-        return False
-    if has_tag(tags, agent_tags["started"]):
-        return False
+    Move child tasks to dest_col_id and return their task dicts.
 
+    Sends every move and read in one JSON-RPC batch (Kanboard runs batch
+    elements in order, so each read sees its move); falls back to one call
+    at a time if the batch request fails.
+    """
+    moves = []
+    if dest_col_id is not None:
+        moves = [("updateTask", {"id": cid, "column_id": dest_col_id}) for cid in child_ids]
+    reads = [("getTask", {"task_id": cid}) for cid in child_ids]
     try:
-        fields = get_task_fields(kb, task_id)
-        dirname = fields["dirname"]
-    except TaskFieldError:
-        return False
-
-    log.info(f"Processing Test Generation: {title}", task_id=task_id)
-    
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
-    update_status(kb, task_id, agent_status="running", current_phase="tests")
-
-    result = run_test_agent(
-        task_id=str(task_id),
-        title=title,
-        dirname=dirname,
-        kb_client=kb,
-        project_id=project_id
-    )
+        results = batch_call(kb, moves + reads)[len(moves):]
+        return [None if isinstance(r, BatchCallError) else r for r in results]
+    except Exception as e:
+        log.warning(f"Batch child update failed, sending calls individually: {e}")
 
-    if result["success"]:
-        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="completed", current_phase="tests")
-        test_plan = result.get("test_plan", "test plan")
-        log.info(f"Success: Created {test_plan}", task_id=task_id)
-        kb.create_comment(task_id=task_id, user_id=1, content=f"**TEST_AGENT**: Created test plan `{test_plan}`.\n\nReady for Human Review.")
-        return True
-    else:
-        _mark_agent_failed(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="failed", current_phase="tests")
-        log.error(f"Test Agent Failed: {result['error']}", task_id=task_id)
-        kb.create_comment(task_id=task_id, user_id=1, content=f"**TEST_AGENT Failed**\n\n{result['error']}")
-        return False
+    children = []
+    for child_id in child_ids:
+        try:
+            if dest_col_id is not None:
+                kb.execute("updateTask", id=child_id, column_id=dest_col_id)
+        except Exception:
+            pass
+        children.append(kb.get_task(task_id=child_id))
+    return children
 
 
 def process_test_code_task(kb, task: dict, project_id: int) -> bool:
     """
     Process a task in the Tests Approved column (Test Code Generation).
     """
-    from agents.test_code_agent import run_test_code_agent
-
     task_id = task['id']
     title = task['title']
 
-    tags = get_task_tags(kb, task_id)
     agent_tags = TAGS["TEST_CODE_AGENT"]
-    _clear_stale_started(kb, project_id, task_id, agent_tags)
-    tags = get_task_tags(kb, task_id)
+    tags = _clear_stale_started(kb, project_id, task_id, agent_tags)
 
     # If this is a parent task, fan out test generation to children
     try:
@@ -577,9 +842,11 @@ def process_test_code_task(kb, task: dict, project_id: int) -> bool:
         child_ids = [int(cid) for cid in child_ids]
         if child_ids:
             try:
-                cols = kb.get_columns(project_id=project_id)
-                dest_col = next((c for c in cols if "Tests Approved" in c["title"]), None)
-                dest_col_id = int(dest_col["id"]) if dest_col else None
+                col_map, _ = get_column_maps(kb, project_id)
+                dest_col_id = next(
+                    (int(cid) for title, cid in col_map.items() if "Tests Approved" in title),
+                    None,
+                )
             except Exception:
                 dest_col_id = None
 
@@ -587,33 +854,27 @@ def process_test_code_task(kb, task: dict, project_id: int) -> bool:
                 f"Parent detected. Generating tests for {len(child_ids)} children...",
                 task_id=task_id,
             )
-            for child_id in child_ids:
-                try:
-                    if dest_col_id is not None:
-                        kb.execute("updateTask", id=child_id, column_id=dest_col_id)
-                except Exception:
-                    pass
-                child_task = kb.get_task(task_id=child_id)
-                if child_task:
-                    process_test_code_task(kb, child_task, project_id)
-            return True
+            processed_any = False
+            for child_task in _move_and_fetch_children(kb, child_ids, dest_col_id):
+                if child_task and process_test_code_task(kb, child_task, project_id):
+                    processed_any = True
+            return processed_any
 
     if has_tag(tags, agent_tags["completed"]):
         # Still enforce governance even if code gen is done
-        process_governance_task(kb, task, project_id)
-        return True
+        return process_governance_task(kb, task, project_id)
     if has_tag(tags, agent_tags["started"]):
         return False
 
     try:
-        fields = get_task_fields(kb, task_id)
+        fields = get_task_fields_cached(kb, task)
         dirname = fields["dirname"]
     except TaskFieldError:
         return False
 
     log.info(f"Processing Test Code Generation: {title}", task_id=task_id)
 
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
+    tags = add_task_tag(kb, project_id, task_id, agent_tags["started"], known_tags=tags)
     update_status(kb, task_id, agent_status="running", current_phase="tests")
 
     result = run_test_code_agent(
@@ -625,11 +886,12 @@ def process_test_code_task(kb, task: dict, project_id: int) -> bool:
     )
 
     if result["success"]:
-        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="completed", current_phase="tests")
         test_file = result.get("test_file", "test file")
         log.info(f"Success: Created {test_file}", task_id=task_id)
-        kb.create_comment(task_id=task_id, user_id=1, content=f"**TEST_CODE_AGENT**: Created test file `{test_file}`.\n\nTests are now locked. Move to **Ralph Loop** for implementation.")
+        _complete_agent_run(
+            kb, project_id, task_id, agent_tags, phase="tests",
+            comment=f"**TEST_CODE_AGENT**: Created test file `{test_file}`.\n\nTests are now locked. Move to **Ralph Loop** for implementation.",
+        )
         # Chain Governance to lock tests
         process_governance_task(kb, task, project_id)
         return True
@@ -641,132 +903,16 @@ def process_test_code_task(kb, task: dict, project_id: int) -> bool:
         return False
 
 
-def process_ralph_task(kb, task: dict, project_id: int) -> bool:
-    """
-    Process a task in the Ralph Loop column.
-    """
-    from agents.ralph import run_ralph_agent
-
-    task_id = task['id']
-    title = task['title']
-    
-    tags = get_task_tags(kb, task_id)
-    agent_tags = TAGS["RALPH_CODER"]
-    _clear_stale_started(kb, project_id, task_id, agent_tags)
-    tags = get_task_tags(kb, task_id)
-
-    if has_tag(tags, agent_tags["completed"]):
-        return False
-    if has_tag(tags, agent_tags["started"]):
-        return False
-    
-    try:
-        fields = get_task_fields(kb, task_id)
-        dirname = fields["dirname"]
-    except TaskFieldError:
-        return False
-
-    log.info(f"Processing Ralph Loop: {title}", task_id=task_id)
-    
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
-    update_status(kb, task_id, agent_status="running", current_phase="coding")
-
-    result = run_ralph_agent(
-        task_id=str(task_id),
-        title=title,
-        dirname=dirname,
-        kb_client=kb,
-        project_id=project_id
-    )
-
-    if result["success"]:
-        _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="completed", current_phase="coding")
-        log.info(f"Success: Green Bar in {result['iterations']} iterations", task_id=task_id)
-        kb.create_comment(task_id=task_id, user_id=1, content=f"**RALPH**: Tests passed in {result['iterations']} iterations. Code committed.")
-        return True
-    else:
-        _mark_agent_failed(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="failed", current_phase="coding")
-        log.error(f"Ralph Failed: {result['error']}", task_id=task_id)
-        kb.create_comment(task_id=task_id, user_id=1, content=f"**RALPH Failed**\n\n{result['error']}")
-        return False
-
-
-def process_code_review_task(kb, task: dict, project_id: int) -> bool:
-    """
-    Process a task in the Code Review column.
-    """
-    from agents.code_review import run_code_review_agent
-
-    task_id = task["id"]
-    title = task["title"]
-
-    tags = get_task_tags(kb, task_id)
-    agent_tags = TAGS["CODE_REVIEW_AGENT"]
-    _clear_stale_started(kb, project_id, task_id, agent_tags)
-    tags = get_task_tags(kb, task_id)
-
-    if has_tag(tags, agent_tags["completed"]):
-        return False
-    if has_tag(tags, agent_tags["started"]):
-        return False
-
-    # Enforce that coding completed before review starts.
-    if not has_tag(tags, TAGS["RALPH_CODER"]["completed"]):
-        _mark_agent_failed(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="failed", current_phase="review")
-        kb.create_comment(
-            task_id=task_id,
-            user_id=1,
-            content="**CODE_REVIEW_AGENT Failed**\n\nMissing `coding-complete` tag. Complete Ralph loop before code review.",
-        )
-        return False
-
-    try:
-        fields = get_task_fields(kb, task_id)
-        dirname = fields["dirname"]
-    except TaskFieldError:
-        return False
-
-    log.info(f"Processing Code Review: {title}", task_id=task_id)
-
-    add_task_tag(kb, project_id, task_id, agent_tags["started"])
-    update_status(kb, task_id, agent_status="running", current_phase="review")
-
-    result = run_code_review_agent(
-        task_id=str(task_id),
-        title=title,
-        dirname=dirname,
-        kb_client=kb,
-        project_id=project_id,
-    )
-
-    if result["success"]:
-        if result.get("gate_passed", False):
-            _mark_agent_succeeded(kb, project_id, task_id, agent_tags)
-            update_status(kb, task_id, agent_status="completed", current_phase="review")
-            log.info(
-                "Code review completed",
-                task_id=task_id,
-                overall_status=result.get("overall_status"),
-                findings=result.get("finding_count"),
-            )
-            return True
-        _mark_agent_failed(kb, project_id, task_id, agent_tags)
-        update_status(kb, task_id, agent_status="failed", current_phase="review")
-        kb.create_comment(
-            task_id=task_id,
-            user_id=1,
-            content="**CODE_REVIEW_AGENT Gate Failed**\n\nReview status is FAIL. See `reviews/CODE_REVIEW_NEXT_STEPS.md`.",
-        )
-        return False
-
-    _mark_agent_failed(kb, project_id, task_id, agent_tags)
-    update_status(kb, task_id, agent_status="failed", current_phase="review")
-    log.error(f"Code Review Failed: {result['error']}", task_id=task_id)
-    kb.create_comment(task_id=task_id, user_id=1, content=f"**CODE_REVIEW_AGENT Failed**\n\n{result['error']}")
-    return False
+# Trigger action -> task processor
+_DISPATCH = {
+    **{
+        action: functools.partial(_run_agent_task, spec=spec)
+        for action, spec in _AGENT_SPECS.items()
+    },
+    "GOVERNANCE_AGENT": process_governance_task,
+    "SPAWNER_AGENT": process_spawner_task,
+    "TEST_CODE_AGENT": process_test_code_task,
+}
 
 
 def process_task(
@@ -798,31 +944,132 @@ def process_task(
             )
             return False
 
-    if action == "ARCHITECT_AGENT":
-        return process_architect_task(kb, task, project_id)
+    handler = _DISPATCH.get(action)
+    if handler is None:
+        return False
 
-    elif action == "GOVERNANCE_AGENT":
-        return process_governance_task(kb, task, project_id)
+    with _claim_task(task_id) as claimed:
+        if not claimed:
+            log.info("Task claimed by another orchestrator", task_id=task_id, action=action)
+            return False
+        return handler(kb, task, project_id)
 
-    elif action == "PM_AGENT":
-        return process_pm_task(kb, task, project_id)
 
-    elif action == "SPAWNER_AGENT":
-        return process_spawner_task(kb, task, project_id)
+@contextlib.contextmanager
+def _claim_task(task_id: int):
+    """
+    Hold an exclusive claim on a task while its agent runs.
 
-    elif action == "TEST_AGENT":
-        return process_test_task(kb, task, project_id)
+    Yields False if another orchestrator process on this host already holds
+    it. Handlers re-read tags after claiming, so a run that finished between
+    the poll and the claim is seen as started/completed and skipped.
+    """
+    if fcntl is None:
+        yield True
+        return
+    CLAIMS_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(CLAIMS_DIR / f"{int(task_id)}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def _trigger_actions_by_column(col_id_to_name: dict) -> dict:
+    """Resolve trigger actions once per column map instead of once per task."""
+    col_id_to_action = {}
+    for col_id, col_name in col_id_to_name.items():
+        action = resolve_trigger_action(col_name)
+        if action:
+            col_id_to_action[col_id] = action
+    return col_id_to_action
 
-    elif action == "TEST_CODE_AGENT":
-        return process_test_code_task(kb, task, project_id)
 
-    elif action == "RALPH_CODER":
-        return process_ralph_task(kb, task, project_id)
+def _fetch_trigger_tasks(kb, project_id: int, col_id_to_name: dict) -> list:
+    """
+    Fetch open tasks in trigger columns only.
 
-    elif action == "CODE_REVIEW_AGENT":
-        return process_code_review_task(kb, task, project_id)
+    Uses searchTasks so Kanboard filters by column server-side (repeated
+    column: filters are ORed); falls back to getAllTasks for open tasks if
+    the search fails.
+    """
+    trigger_titles = [
+        col_id_to_name[c] for c in get_trigger_actions(kb, project_id) if c in col_id_to_name
+    ]
+    if not trigger_titles:
+        return []
+
+    query = "status:open " + " ".join(
+        'column:"{}"'.format(title.replace('"', '')) for title in trigger_titles
+    )
+    try:
+        tasks = kb.search_tasks(project_id=project_id, query=query)
+    except Exception as e:
+        log.warning(f"searchTasks failed, falling back to getAllTasks: {e}")
+        tasks = kb.get_all_tasks(project_id=project_id, status_id=1)
+    return tasks or []
 
-    return False
+
+def _iter_pending_tasks(kb, project_id: int, tasks: list, col_id_to_name: dict):
+    """
+    Yield (task, action, work_package_dir) for open trigger-column tasks that
+    are neither completed nor in progress.
+
+    Tags for all trigger-column tasks are fetched up front in one batch
+    request instead of one request per task. Cards found completed are not
+    re-checked for COMPLETED_CACHE_TTL seconds, so a manually cleared
+    completed tag is picked up on the next pass after that.
+    """
+    col_id_to_action = get_trigger_actions(kb, project_id)
+
+    now = time.monotonic()
+    with _COMPLETED_LOCK:
+        for key in [k for k, expires in _COMPLETED_SEEN.items() if expires <= now]:
+            del _COMPLETED_SEEN[key]
+        completed_seen = set(_COMPLETED_SEEN)
+
+    candidates = []
+    for task in tasks:
+        # Cheap in-memory checks first; only survivors cost a tag lookup
+        if str(task.get('is_active', 1)) == '0':
+            continue
+        action = col_id_to_action.get(task['column_id'])
+        if action is not None and (int(task['id']), action) not in completed_seen:
+            candidates.append((task, action))
+    if not candidates:
+        return
+
+    tags_by_id = get_task_tags_bulk(kb, [task['id'] for task, _ in candidates])
+
+    for task, action in candidates:
+        work_package_dir: Path | None = None
+        if SINGLE_CARD_MODE:
+            col_name = col_id_to_name.get(task['column_id'])
+            if col_name is None:
+                continue  # Column added after the map was cached; next refresh picks it up
+            work_package_dir = _sync_single_card_state(kb, task, project_id, col_name)
+
+        # Check if already processed
+        tags = tags_by_id.get(int(task['id']), frozenset())
+        started_tag = _STARTED_TAG[action]
+        if _FAILED_TAG[action] in tags and started_tag in tags:
+            tags = _clear_stale_started(kb, project_id, task['id'], TAGS[action], tags=tags)
+
+        if _COMPLETED_TAG[action] in tags:
+            with _COMPLETED_LOCK:
+                _COMPLETED_SEEN[(int(task['id']), action)] = now + COMPLETED_CACHE_TTL
+            continue  # Skip completed tasks
+
+        if started_tag in tags:
+            continue  # Skip in-progress tasks
+
+        yield task, action, work_package_dir
 
 
 def run_once(kb, project_id: int = 1):
@@ -833,100 +1080,212 @@ def run_once(kb, project_id: int = 1):
     log.info("Single-run mode: checking for work...")
 
     # Get column mapping
-    cols = kb.get_columns(project_id=project_id)
-    col_map = {c['title']: c['id'] for c in cols}
-    col_id_to_name = {c['id']: c['title'] for c in cols}
+    _, col_id_to_name = get_column_maps(kb, project_id)
 
     # Get all tasks
-    tasks = kb.get_all_tasks(project_id=project_id)
+    tasks = _fetch_trigger_tasks(kb, project_id, col_id_to_name)
+
+    for task, action, work_package_dir in _iter_pending_tasks(kb, project_id, tasks, col_id_to_name):
+        # Found an unprocessed task
+        if process_task(kb, task, action, project_id, work_package_dir=work_package_dir):
+            log.info("Run Once completed successfully.")
+            return
+        else:
+            # Task wasn't fully processed, but we tried
+            log.warning("Task processing did not complete successfully.")
+            return
 
-    for task in tasks:
-        col_id = task['column_id']
-        col_name = col_id_to_name.get(col_id)
+    log.info("No unprocessed tasks found in trigger columns.")
 
-        action = resolve_trigger_action(col_name)
-        if action:
-            work_package_dir: Path | None = None
-            if SINGLE_CARD_MODE and col_name:
-                work_package_dir = _sync_single_card_state(kb, task, project_id, col_name)
 
-            # Check if already processed
-            tags = get_task_tags(kb, task['id'])
-            agent_tags = TAGS.get(action, {})
-            _clear_stale_started(kb, project_id, task['id'], agent_tags)
-            tags = get_task_tags(kb, task['id'])
+def _submit_task(kb, task: dict, action: str, project_id: int, work_package_dir: Path | None):
+    """Submit a task to the worker pool unless it is already being processed."""
+    task_id = int(task['id'])
+    with _IN_FLIGHT_LOCK:
+        if task_id in _IN_FLIGHT:
+            return None
+        _IN_FLIGHT.add(task_id)
 
-            if has_tag(tags, agent_tags.get("completed", "")):
-                continue  # Skip completed tasks
+    def _release(future):
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT.discard(task_id)
+        # Webhook dispatches never read the result, so errors are logged here
+        if not future.cancelled() and future.exception() is not None:
+            log.error(f"Task processing error: {future.exception()}", task_id=task_id)
 
-            if has_tag(tags, agent_tags.get("started", "")):
-                continue  # Skip in-progress tasks
+    future = EXECUTOR.submit(
+        process_task, kb, task, action, project_id, work_package_dir=work_package_dir
+    )
+    future.add_done_callback(_release)
+    return future
 
-            # Found an unprocessed task
-            if process_task(kb, task, action, project_id, work_package_dir=work_package_dir):
-                log.info("Run Once completed successfully.")
-                return
-            else:
-                # Task wasn't fully processed, but we tried
-                log.warning("Task processing did not complete successfully.")
-                return
 
-    log.info("No unprocessed tasks found in trigger columns.")
+def _poll_once(kb, project_id: int) -> int:
+    """
+    Run a single polling pass over the board.
 
+    Pending tasks are processed on EXECUTOR (AGENTLEEOPS_CONCURRENCY workers)
+    and the pass waits for all of them before returning.
 
-def run_polling(kb, project_id: int = 1, poll_interval: int = 5):
-    """
-    Polling mode: Continuously watch for cards in trigger columns.
+    Returns:
+        Number of tasks that were processed during this pass
     """
-    log.info(f"Polling mode: watching {KB_URL}", poll_interval=poll_interval)
-    
-    # Get column mapping
-    cols = kb.get_columns(project_id=project_id)
-    col_map = {c['title']: c['id'] for c in cols}
-    col_id_to_name = {c['id']: c['title'] for c in cols}
+    _, col_id_to_name = get_column_maps(kb, project_id)
+    tasks = _fetch_trigger_tasks(kb, project_id, col_id_to_name)
 
-    print("Board Columns:")
-    for c in cols:
-        trigger = " <- TRIGGER" if resolve_trigger_action(c["title"]) else ""
-        print(f"  {c['id']}: {c['title']}{trigger}")
-    print()
+    futures = []
+    for task, action, work_package_dir in _iter_pending_tasks(kb, project_id, tasks, col_id_to_name):
+        future = _submit_task(kb, task, action, project_id, work_package_dir)
+        if future is not None:
+            futures.append(future)
+    wait(futures)
 
-    while True:
+    # Failed tasks were already logged by _submit_task's done-callback
+    return sum(1 for future in futures if not future.exception() and future.result())
+
+
+def _handle_webhook_event(kb, project_id: int, data: dict) -> None:
+    """Dispatch the card named in a Kanboard webhook event, if it is pending."""
+    event_name = data.get("event_name", "")
+    if event_name not in WEBHOOK_EVENTS:
+        return
+
+    event_data = data.get("event_data") or {}
+    task_id = event_data.get("task_id")
+    if not task_id:
+        log.warning("Webhook event without task_id", event=event_name)
+        return
+
+    # Kanboard embeds the task in the event; only fetch it if it is missing
+    task = event_data.get("task")
+    if isinstance(task, dict) and task.get("id"):
+        task = dict(task)
+        dst_column_id = event_data.get("dst_column_id")
+        if dst_column_id and "column_id" in task:
+            # Match the id type Kanboard uses in column and task payloads
+            task["column_id"] = type(task["column_id"])(dst_column_id)
+    else:
+        task = kb.get_task(task_id=int(task_id))
+    if not task or int(task.get("project_id", project_id)) != int(project_id):
+        return
+
+    _, col_id_to_name = get_column_maps(kb, project_id)
+    if task.get("column_id") not in col_id_to_name:
+        # Card moved into a column created after the maps were cached
+        _cached_column_maps.cache_clear()
+        _, col_id_to_name = get_column_maps(kb, project_id)
+    for task, action, work_package_dir in _iter_pending_tasks(kb, project_id, [task], col_id_to_name):
+        log.info("Webhook dispatch", task_id=task["id"], action=action, event=event_name)
+        _submit_task(kb, task, action, project_id, work_package_dir)
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Receive Kanboard webhooks and hand the affected card to EXECUTOR."""
+
+    def do_POST(self):
+        if WEBHOOK_TOKEN:
+            token = parse_qs(urlparse(self.path).query).get("token", [""])[0]
+            if not hmac.compare_digest(token.encode(), WEBHOOK_TOKEN.encode()):
+                self.send_response(403)
+                self.end_headers()
+                return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self.send_response(202)
+        self.end_headers()
+
+        try:
+            data = json.loads(body)
+        except ValueError:
+            log.warning("Invalid webhook payload")
+            return
         try:
-            tasks = kb.get_all_tasks(project_id=project_id)
+            _handle_webhook_event(self.server.kb, self.server.project_id, data)
+        except Exception as e:
+            log.error(f"Webhook Error: {e}")
+
+    def log_message(self, format, *args):
+        """Suppress default request logging."""
+        pass
+
 
-            for task in tasks:
-                col_id = task['column_id']
-                col_name = col_id_to_name.get(col_id)
+def start_webhook_listener(
+    kb, project_id: int, port: int, host: str = WEBHOOK_HOST
+) -> ThreadingHTTPServer:
+    """Serve Kanboard webhooks on a background thread."""
+    server = ThreadingHTTPServer((host, port), _WebhookHandler)
+    server.kb = kb
+    server.project_id = project_id
+    threading.Thread(target=server.serve_forever, name="webhook", daemon=True).start()
+    log.info(f"Webhook listener on {host}:{server.server_port}", host=host, port=server.server_port)
+    return server
 
-                action = resolve_trigger_action(col_name)
-                if action:
-                    work_package_dir: Path | None = None
-                    if SINGLE_CARD_MODE and col_name:
-                        work_package_dir = _sync_single_card_state(kb, task, project_id, col_name)
 
-                    # Check if already processed
-                    tags = get_task_tags(kb, task['id'])
-                    agent_tags = TAGS.get(action, {})
-                    _clear_stale_started(kb, project_id, task['id'], agent_tags)
-                    tags = get_task_tags(kb, task['id'])
+def _install_wake_handler() -> None:
+    """Let `kill -USR1 <pid>` cut an idle polling sleep short."""
+    if not hasattr(signal, "SIGUSR1"):
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    signal.signal(signal.SIGUSR1, lambda signum, frame: _WAKE_EVENT.set())
 
-                    if has_tag(tags, agent_tags.get("completed", "")):
-                        continue
 
-                    if has_tag(tags, agent_tags.get("started", "")):
-                        continue
+def run_polling(
+    kb,
+    project_id: int = 1,
+    poll_interval: int = 5,
+    idle_interval: int = MAX_POLL_INTERVAL,
+):
+    """
+    Polling mode: Continuously watch for cards in trigger columns.
 
-                    # Process the task
-                    process_task(kb, task, action, project_id, work_package_dir=work_package_dir)
+    While passes keep finding work the board is re-polled after a short
+    DRAIN_INTERVAL pause so the trigger columns drain quickly. Idle passes
+    back off exponentially up to ``idle_interval``; any wait can be
+    interrupted by SIGUSR1.
+    """
+    log.info(
+        f"Polling mode: watching {KB_URL}",
+        poll_interval=poll_interval,
+        idle_interval=idle_interval,
+    )
+    _install_wake_handler()
 
+    # Get column mapping
+    _, col_id_to_name = get_column_maps(kb, project_id)
+
+    log.info(
+        "Board columns",
+        columns=[
+            {"id": col_id, "title": col_title, "action": resolve_trigger_action(col_title)}
+            for col_id, col_title in col_id_to_name.items()
+        ],
+    )
+
+    delay = poll_interval
+    while True:
+        processed = 0
+        try:
+            processed = _poll_once(kb, project_id)
         except KeyboardInterrupt:
             log.info("Stopping orchestrator.")
             break
         except Exception as e:
             log.error(f"Polling Error: {e}")
 
-        time.sleep(poll_interval)
+        if processed:
+            # Drain the trigger columns before going idle again
+            delay = poll_interval
+            pause = min(DRAIN_INTERVAL, poll_interval)
+        else:
+            # Back off exponentially (with jitter) while the board is idle
+            delay = min(delay * 2, max(idle_interval, poll_interval))
+            pause = delay + random.uniform(0, 0.5 * delay)
+        if _WAKE_EVENT.wait(pause):
+            log.info("Woken early, polling now")
+            _WAKE_EVENT.clear()
+            delay = poll_interval
 
 
 def main():
@@ -950,15 +1309,46 @@ def main():
         default=5,
         help="Polling interval in seconds (default: 5)"
     )
+    parser.add_argument(
+        "--idle-interval",
+        type=int,
+        default=None,
+        help=(
+            "Longest wait between polls while the board is idle "
+            f"(default: {MAX_POLL_INTERVAL}, or {WEBHOOK_RECONCILE_INTERVAL} with --webhook-port)"
+        )
+    )
+    parser.add_argument(
+        "--webhook-port",
+        type=int,
+        default=None,
+        help="Also accept Kanboard webhooks on this port; polling becomes a slow reconciliation pass"
+    )
+    parser.add_argument(
+        "--webhook-host",
+        default=WEBHOOK_HOST,
+        help=f"Interface for the webhook listener (default: {WEBHOOK_HOST})"
+    )
 
     args = parser.parse_args()
 
+    enable_queue_logging()
     kb = connect_kb()
 
     if args.once:
         run_once(kb, project_id=args.project_id)
     else:
-        run_polling(kb, project_id=args.project_id, poll_interval=args.poll_interval)
+        idle_interval = args.idle_interval
+        if args.webhook_port:
+            start_webhook_listener(kb, args.project_id, args.webhook_port, host=args.webhook_host)
+            if idle_interval is None:
+                idle_interval = WEBHOOK_RECONCILE_INTERVAL
+        run_polling(
+            kb,
+            project_id=args.project_id,
+            poll_interval=args.poll_interval,
+            idle_interval=idle_interval if idle_interval is not None else MAX_POLL_INTERVAL,
+        )
 
 
 if __name__ == "__main__":
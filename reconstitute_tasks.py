@@ -1,8 +1,9 @@
 
 import os
+import sys
 import json
 from dotenv import load_dotenv
-from kanboard import Client
+from lib.kanboard_rpc import BatchCallError, SessionClient, batch_call
 
 load_dotenv()
 
@@ -13,7 +14,7 @@ PROJECT_ID = 1
 DIRNAME = "hello-fire"
 
 def main():
-    kb = Client(KB_URL, KB_USER, KB_TOKEN)
+    kb = SessionClient(KB_URL, KB_USER, KB_TOKEN)
     
     # 1. Read PRD
     prd_path = f"/home/lee/projects/{DIRNAME}/prd.json"
@@ -45,8 +46,6 @@ def main():
     
     TEMPLATE_TASK_ID = 7 # Known existing task
     
-    print(f"Target Column: {target_col_id}")
-    
     # 3. Create Parent (via Duplication)
     parent_title = f"{prd['project_name']} Implementation"
     parent_id = kb.execute("duplicateTaskToProject", task_id=TEMPLATE_TASK_ID, project_id=PROJECT_ID)
@@ -55,36 +54,75 @@ def main():
         print("Failed to duplicate parent template.")
         return
 
-    kb.execute("updateTask", 
-        id=int(parent_id), 
-        title=parent_title, 
-        description="Reconstituted Parent",
-        column_id=target_col_id
-    )
     print(f"Created Parent #{parent_id}: {parent_title}")
     
     # 4. Create Children
-    for story in prd['stories']:
+    # Two JSON-RPC batches instead of 4 calls per story: duplicate every
+    # child, then update/tag/link them all (plus the parent) in one request.
+    stories = prd['stories']
+    child_ids = batch_call(kb, [
+        ("duplicateTaskToProject", {"task_id": TEMPLATE_TASK_ID, "project_id": PROJECT_ID})
+        for _ in stories
+    ])
+    
+    calls = [("updateTask", {
+        "id": int(parent_id),
+        "title": parent_title,
+        "description": "Reconstituted Parent",
+        "column_id": target_col_id
+    })]
+    # Per-parent values shared by every child call, built once
+    parent_task_id = int(parent_id)
+    shared_meta = {"parent_id": str(parent_id), "dirname": DIRNAME}
+    created = []
+    failed = 0
+    for story, child_id in zip(stories, child_ids):
         title = f"[{story['id']}] {story['title']}"
-        child_id = kb.execute("duplicateTaskToProject", task_id=TEMPLATE_TASK_ID, project_id=PROJECT_ID)
-        
-        kb.execute("updateTask", 
-             id=int(child_id), 
-             title=title, 
-             description=story['description'],
-             column_id=target_col_id
-        )
-        
-        # Metadata
-        kb.execute("saveTaskMetadata", task_id=int(child_id), values={
-            "atomic_id": story['id'],
-            "parent_id": str(parent_id),
-            "dirname": DIRNAME
-        })
-        
-        # Link
-        kb.create_task_link(task_id=int(child_id), opposite_task_id=int(parent_id), link_id=1)
-        print(f"  Created Child #{child_id}: {title} (Linked)")
+        if isinstance(child_id, BatchCallError) or not child_id:
+            print(f"  Failed to duplicate child {title}: {child_id}")
+            failed += 1
+            continue
+        calls += [
+            ("updateTask", {
+                "id": int(child_id),
+                "title": title,
+                "description": story['description'],
+                "column_id": target_col_id
+            }),
+            # Metadata
+            ("saveTaskMetadata", {"task_id": int(child_id), "values": {
+                "atomic_id": story['id'],
+                **shared_meta
+            }}),
+            # Link
+            ("createTaskLink", {"task_id": int(child_id), "opposite_task_id": parent_task_id, "link_id": 1}),
+        ]
+        created.append((child_id, title))
+    
+    # Results come back in call order: the parent update, then three per child
+    results = batch_call(kb, calls)
+    parent_result, child_results = results[0], results[1:]
+    parent_failed = isinstance(parent_result, BatchCallError) or not parent_result
+    if parent_failed:
+        print(f"  Failed to update parent #{parent_id}: {parent_result}")
+    for i, (child_id, title) in enumerate(created):
+        step_results = child_results[3 * i:3 * i + 3]
+        step_names = ("update", "metadata", "link")
+        errors = [
+            f"{name}: {result}"
+            for name, result in zip(step_names, step_results)
+            if isinstance(result, BatchCallError) or not result
+        ]
+        if errors:
+            print(f"  Failed Child #{child_id}: {title} ({'; '.join(errors)})")
+            failed += 1
+        else:
+            print(f"  Created Child #{child_id}: {title} (Linked)")
+
+    if failed:
+        print(f"\n{failed} child task(s) were not created and linked.")
+    if failed or parent_failed:
+        sys.exit(1)
 
     print("\nDone. You can now run Ralph on Parent #" + str(parent_id))
 
@@ -2,7 +2,7 @@
 import os
 import sys
 from dotenv import load_dotenv
-from kanboard import Client
+from lib.kanboard_rpc import BatchCallError, SessionClient, batch_call
 from agents.test_agent import run_test_agent
 from agents.test_code_agent import run_test_code_agent
 from agents.governance import run_governance_agent
@@ -19,7 +19,7 @@ TITLE = "[atomic-03] Create Project README"
 DIRNAME = "hello-fire"
 
 def main():
-    kb = Client(KB_URL, KB_USER, KB_TOKEN)
+    kb = SessionClient(KB_URL, KB_USER, KB_TOKEN)
     project_id = 1
     
     # 1. Get Column ID for "7. Tests Approved"
@@ -55,15 +55,20 @@ def main():
         
     print(f"Created Task #{task_id}")
     
-    # 3. Set Metadata
-    kb.execute("saveTaskMetadata", task_id=int(task_id), values={
-        "atomic_id": ATOMIC_ID,
-        "parent_id": str(PARENT_ID),
-        "dirname": DIRNAME
-    })
-    
-    # 4. Link to Parent
-    kb.create_task_link(task_id=int(task_id), opposite_task_id=PARENT_ID, link_id=1)
+    # 3. Set Metadata + 4. Link to Parent (one batch; the agents below read
+    # the metadata, so it must land before they start)
+    results = batch_call(kb, [
+        ("saveTaskMetadata", {"task_id": int(task_id), "values": {
+            "atomic_id": ATOMIC_ID,
+            "parent_id": str(PARENT_ID),
+            "dirname": DIRNAME
+        }}),
+        ("createTaskLink", {"task_id": int(task_id), "opposite_task_id": PARENT_ID, "link_id": 1}),
+    ])
+    errors = [r for r in results if isinstance(r, BatchCallError)]
+    if errors:
+        print(f"Error: {errors}")
+        return
     print("Linked to Parent")
     
     # 5. Force Run Agents
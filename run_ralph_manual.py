@@ -2,7 +2,7 @@
 import os
 import sys
 from dotenv import load_dotenv
-from kanboard import Client
+from lib.kanboard_rpc import SessionClient
 from agents.ralph import run_ralph_agent
 
 load_dotenv()
@@ -14,7 +14,7 @@ KB_TOKEN = os.getenv("KANBOARD_TOKEN")
 TASK_ID = 25 # Reconstituted Parent
 
 def main():
-    kb = Client(KB_URL, KB_USER, KB_TOKEN)
+    kb = SessionClient(KB_URL, KB_USER, KB_TOKEN)
     print(f"Manually running Ralph for Task #{TASK_ID}...")
     
     # Get Task
@@ -14,7 +14,7 @@ It will:
 import os
 import sys
 from dotenv import load_dotenv
-from kanboard import Client
+from lib.kanboard_rpc import BatchCallError, SessionClient, batch_call
 
 # Load environment variables
 load_dotenv()
@@ -57,7 +57,7 @@ TAGS = ["needs-human", "approved", "EXISTING", "NEW"]
 
 def connect():
     try:
-        return Client(KB_URL, KB_USER, KB_TOKEN)
+        return SessionClient(KB_URL, KB_USER, KB_TOKEN)
     except Exception as e:
         print(f"❌ Could not connect to {KB_URL}. Check Docker is up.")
         sys.exit(1)
@@ -96,21 +96,42 @@ def configure_columns(kb, project_id):
     print("   -> Normalizing columns (This might take a moment)...")
 
     # Kanboard requires at least one column. We create a temp one, delete others, then remove temp.
-    kb.add_column(project_id=project_id, title="TEMP_SETUP")
-    temp_cols = kb.get_columns(project_id=project_id)
-    temp_id = next(c['id'] for c in temp_cols if c['title'] == "TEMP_SETUP")
-
-    for col in current_cols:
-        kb.remove_column(column_id=col['id'])
+    # addColumn returns the new column id, so no re-fetch is needed.
+    temp_id = kb.add_column(project_id=project_id, title="TEMP_SETUP")
+    if not temp_id:
+        print("   -> Could not create TEMP_SETUP column. Aborting.")
+        return
 
-    # 3. Create New Columns in Order
-    for title, limit in COLUMNS:
-        kb.add_column(project_id=project_id, title=title, task_limit=limit)
-        print(f"      + Created: {title} (Limit: {limit})")
+    # One JSON-RPC batch for every removal, one for every addition
+    # (Kanboard runs batched calls in order, so column positions hold).
+    removed = batch_call(kb, [("removeColumn", {"column_id": col['id']}) for col in current_cols])
+    failed = [
+        (col, result) for col, result in zip(current_cols, removed)
+        if isinstance(result, BatchCallError) or not result
+    ]
+    for col, result in failed:
+        print(f"      ! Failed to remove: {col['title']} ({result})")
+
+    # 3. Create New Columns in Order, then 4. Remove Temp.
+    # The other columns are already gone, so rebuild the pipeline even if a
+    # removal failed; only columns that survived under a PRD title are skipped.
+    kept_titles = {col['title'] for col, _ in failed}
+    to_add = [(title, limit) for title, limit in COLUMNS if title not in kept_titles]
+    results = batch_call(kb, [
+        ("addColumn", {"project_id": project_id, "title": title, "task_limit": limit})
+        for title, limit in to_add
+    ] + [("removeColumn", {"column_id": temp_id})])
+    for (title, limit), result in zip(to_add, results):
+        if isinstance(result, BatchCallError) or not result:
+            print(f"      ! Failed to create: {title} ({result})")
+        else:
+            print(f"      + Created: {title} (Limit: {limit})")
 
-    # 4. Remove Temp
-    kb.remove_column(column_id=temp_id)
-    print("   -> Columns synced to PRD.")
+    if failed:
+        print("   -> Pipeline rebuilt, but some old columns could not be removed.")
+        print("      Remove or reorder them in Kanboard and re-run.")
+    else:
+        print("   -> Columns synced to PRD.")
 
 def configure_tags(kb, project_id):
     print("🏷️  Configuring Tags...")
@@ -127,12 +148,20 @@ def configure_tags(kb, project_id):
        existing_names = {t['name'] for t in existing_tags}
 
     for tag in TAGS:
-        if tag not in existing_names:
-            kb.create_tag(project_id=project_id, tag=tag)
-            print(f"      + Created Tag: {tag}")
-        else:
+        if tag in existing_names:
             print(f"      . Tag '{tag}' exists.")
 
+    # Create every missing tag in one JSON-RPC batch
+    missing = [tag for tag in TAGS if tag not in existing_names]
+    results = batch_call(kb, [
+        ("createTag", {"project_id": project_id, "tag": tag}) for tag in missing
+    ])
+    for tag, result in zip(missing, results):
+        if isinstance(result, BatchCallError) or not result:
+            print(f"      ! Failed to create tag '{tag}': {result}")
+        else:
+            print(f"      + Created Tag: {tag}")
+
 
 def configure_swimlanes(kb, project_id):
     print("🏊 Configuring Swimlanes...")
@@ -143,15 +172,17 @@ def configure_swimlanes(kb, project_id):
         print(f"   -> Could not load swimlanes: {e}")
         return
 
-    existing_names = {lane["name"] for lane in current}
+    # Lane ids by name; new lanes are added from addSwimlane's return value,
+    # so the list never has to be fetched again
+    lane_ids = {lane["name"]: lane["id"] for lane in current}
 
     for idx, lane_name in enumerate(SWIMLANES, start=2):
-        if lane_name in existing_names:
+        if lane_name in lane_ids:
             print(f"      . Swimlane '{lane_name}' exists.")
             continue
 
         try:
-            kb.execute(
+            lane_ids[lane_name] = kb.execute(
                 "addSwimlane",
                 project_id=int(project_id),
                 name=lane_name,
@@ -162,13 +193,12 @@ def configure_swimlanes(kb, project_id):
             print(f"      ! Failed to create swimlane '{lane_name}': {e}")
 
     try:
-        refreshed = kb.execute("getAllSwimlanes", project_id=int(project_id))
-        parent_lane = next((lane for lane in refreshed if lane["name"] == "Parent Stories"), None)
-        if parent_lane:
+        parent_lane_id = lane_ids.get("Parent Stories")
+        if parent_lane_id:
             kb.execute(
                 "setDefaultSwimlane",
                 project_id=int(project_id),
-                swimlane_id=int(parent_lane["id"]),
+                swimlane_id=int(parent_lane_id),
             )
             print("      . Default swimlane set to 'Parent Stories'.")
     except Exception:
@@ -18,6 +18,7 @@ class Calculator:
 
     def divide(self, a: float, b: float) -> float:
         """Return the quotient of a divided by b."""
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        return a / b
+        try:
+            return a / b
+        except ZeroDivisionError:
+            raise ValueError("Cannot divide by zero") from None
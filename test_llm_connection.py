@@ -2,7 +2,10 @@
 import os
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
@@ -27,21 +30,41 @@ models = [
     "anthropic/claude-opus-4.5"     # User request
 ]
 
-for model in models:
+# One keep-alive session for every probe: a single TLS handshake to OpenRouter.
+# A "ping" is safe to re-send, so rate limits and 5xx responses are retried.
+retries = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["POST"],
+)
+session = requests.Session()
+session.headers.update(headers)
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=len(models), max_retries=retries),
+)
+
+def probe(model):
     data = {
         "model": model,
         "messages": [{"role": "user", "content": "ping"}]
     }
+    return session.post(url, json=data, timeout=(3.05, 30))
 
-    try:
+# Probes are independent, so they run concurrently over the shared pool;
+# results are still reported in model order.
+with session, ThreadPoolExecutor(max_workers=len(models)) as executor:
+    futures = {model: executor.submit(probe, model) for model in models}
+    for model, future in futures.items():
         print(f"\n--- Testing {model} ---")
-        resp = requests.post(url, headers=headers, json=data)
-        print(f"Status: {resp.status_code}")
-        if resp.status_code == 200:
-             print("Success!")
-        else:
-             print(f"Error: {resp.text[:200]}")
-    except Exception as e:
-        print(f"Exception: {e}")
-    except Exception as e:
-        print(f"Exception: {e}")
+        try:
+            resp = future.result()
+            print(f"Status: {resp.status_code}")
+            if resp.ok:
+                print("Success!")
+            else:
+                print(f"Error: {resp.content[:200]!r}")
+            resp.close()
+        except Exception as e:
+            print(f"Exception: {e}")
@@ -9,7 +9,7 @@ def test_ralph_git_guard():
     
     # Init git if needed
     if not (workspace / ".git").exists():
-        subprocess.run(["git", "init"], cwd=workspace)
+        subprocess.run(["git", "init", "--quiet"], cwd=workspace)
         
     test_dir = workspace / "tests"
     test_dir.mkdir(exist_ok=True)
@@ -23,29 +23,30 @@ def test_ralph_git_guard():
     
     print(f"--- Testing Ralph Git Guard in {workspace} ---")
     
-    # 1. Stage only SRC
-    print("1. Staging only src/app.py...")
-    subprocess.run(["git", "add", "src/app.py"], cwd=workspace)
-    ok, offending = verify_no_test_changes(workspace)
-    if ok:
-        print("✅ SUCCESS: Guard allowed src staging.")
-    else:
-        print(f"❌ FAIL: Guard blocked src staging unexpectedly: {offending}")
-        return False
+    try:
+        # 1. Stage only SRC
+        print("1. Staging only src/app.py...")
+        subprocess.run(["git", "add", "src/app.py"], cwd=workspace)
+        ok, offending = verify_no_test_changes(workspace)
+        if ok:
+            print("✅ SUCCESS: Guard allowed src staging.")
+        else:
+            print(f"❌ FAIL: Guard blocked src staging unexpectedly: {offending}")
+            return False
         
-    # 2. Stage TEST
-    print("2. Staging tests/test_fake.py...")
-    subprocess.run(["git", "add", "tests/test_fake.py"], cwd=workspace)
-    ok, offending = verify_no_test_changes(workspace)
-    if not ok:
-        print(f"✅ SUCCESS: Guard BLOCKED test staging: {offending}")
-    else:
-        print("❌ FAIL: Guard ALLOWED test staging!")
-        return False
-        
-    # Cleanup for next test runs
-    subprocess.run(["git", "reset"], cwd=workspace)
-    
+        # 2. Stage TEST
+        print("2. Staging tests/test_fake.py...")
+        subprocess.run(["git", "add", "tests/test_fake.py"], cwd=workspace)
+        ok, offending = verify_no_test_changes(workspace)
+        if not ok:
+            print(f"✅ SUCCESS: Guard BLOCKED test staging: {offending}")
+        else:
+            print("❌ FAIL: Guard ALLOWED test staging!")
+            return False
+    finally:
+        # Unstage on every exit so a failed run cannot poison the next one
+        subprocess.run(["git", "reset", "--quiet"], cwd=workspace)
+
     print("\n--- Ralph Guard Test Suite Passed ---")
     return True
 
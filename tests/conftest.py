@@ -5,3 +5,15 @@ from pathlib import Path
 # Add project root to path so 'lib' module can be imported
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+import pytest
+
+from lib.llm.providers.cli_probe import clear_cli_probe_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cli_probes():
+    """Keep cached CLI health probes from leaking between tests."""
+    clear_cli_probe_cache()
+    yield
+    clear_cli_probe_cache()
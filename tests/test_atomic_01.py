@@ -3,29 +3,29 @@
 import pytest
 
 
-def test_add_returns_sum():
+@pytest.fixture(scope="module")
+def calculator():
     from src.calculator import Calculator
 
-    calculator = Calculator()
-    assert calculator.add(2, 3) == 5
+    return Calculator()
 
 
-def test_subtract_returns_difference():
-    from src.calculator import Calculator
+def test_add_returns_sum(calculator):
+    assert calculator.add(2, 3) == 5
 
-    calculator = Calculator()
-    assert calculator.subtract(5, 3) == 2
 
+def test_subtract_returns_difference(calculator):
+    assert calculator.subtract(5, 3) == 2
 
-def test_multiply_returns_product():
-    from src.calculator import Calculator
 
-    calculator = Calculator()
+def test_multiply_returns_product(calculator):
     assert calculator.multiply(4, 3) == 12
 
 
-def test_divide_returns_quotient():
-    from src.calculator import Calculator
-
-    calculator = Calculator()
+def test_divide_returns_quotient(calculator):
     assert calculator.divide(8, 2) == 4
+
+
+def test_divide_by_zero_raises_value_error(calculator):
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        calculator.divide(1, 0)
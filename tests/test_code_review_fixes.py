@@ -91,7 +91,7 @@ class TestLazyProviderValidation:
         with pytest.raises(ValueError, match="not properly configured"):
             client.complete(role="test", messages=[{"role": "user", "content": "test"}])
 
-    def test_validated_providers_cached(self):
+    def test_validated_providers_cached(self, tmp_path):
         """Validated providers should be cached to avoid re-validation."""
         config = LLMConfig(
             default_role="test",
@@ -111,7 +111,8 @@ class TestLazyProviderValidation:
             },
         )
 
-        client = LLMClient(config, workspace=None)
+        # Keep the trace of the successful call out of the repository
+        client = LLMClient(config, workspace=tmp_path)
 
         # Initially empty
         assert len(client._validated_providers) == 0
@@ -188,6 +189,24 @@ class TestDynamicLogFieldExtraction:
         assert data["usage"]["completion_tokens"] == 50
         assert data["usage"]["total_tokens"] == 150
 
+    def test_json_formatter_uses_record_creation_time(self):
+        """Queued records must keep the time the event happened, not when written."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="Test",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1767225600.25  # 2026-01-01T00:00:00.25Z
+
+        data = json.loads(formatter.format(record))
+
+        assert data["timestamp"] == "2026-01-01T00:00:00.250000+00:00"
+
 
 class TestJSONRepairMetadata:
     """Test Issue 3: JSON repair metadata tracking."""
@@ -290,6 +309,27 @@ class TestLargePromptHandling:
             assert call_args[1]["input"] is not None  # stdin used
             assert large_content not in " ".join(call_args[0][0])  # not in command args
 
+    def test_large_prompt_stdin_is_text(self):
+        """Stdin input must be str because the CLI runs in UTF-8 text mode."""
+        from lib.llm.providers.opencode_cli import OpenCodeCLIProvider
+
+        provider = OpenCodeCLIProvider()
+        large_content = "x" * 150_000
+        request = LLMRequest(
+            role="test",
+            messages=[{"role": "user", "content": large_content}],
+        )
+
+        with patch("lib.llm.providers.opencode_cli.subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="response", stderr="")
+
+            provider.complete(request, {"model": "gpt-4o", "command": "opencode"})
+
+            call_kwargs = mock_run.call_args[1]
+            assert call_kwargs["text"] is True
+            assert call_kwargs["encoding"] == "utf-8"
+            assert call_kwargs["input"] == large_content
+
 
 class TestRawOutputInTraces:
     """Test Issue 5: Raw output in trace files."""
@@ -53,6 +53,18 @@ class TestCodexCLIProvider:
                 provider.validate_config(config)
             assert "not logged in" in str(exc_info.value).lower()
 
+    def test_validate_config_reuses_successful_probes(self):
+        provider = CodexCLIProvider()
+        config = {"command": "codex", "timeout_s": 300}
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="ok", stderr="")
+            provider.validate_config(config)
+            provider.validate_config(config)
+
+        # version + login probed once; the second validation is served from cache
+        assert mock_run.call_count == 2
+
     def test_validate_config_invalid_cwd(self):
         provider = CodexCLIProvider()
         config = {"command": "codex", "timeout_s": 300, "cwd": "/no/such/path"}
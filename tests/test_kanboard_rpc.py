@@ -0,0 +1,166 @@
+"""Tests for Kanboard JSON-RPC helpers."""
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kanboard import ClientError
+
+from lib.kanboard_rpc import DEFAULT_TIMEOUT, BatchCallError, SessionClient, batch_call
+from lib.task_fields import get_task_tags_bulk
+
+
+class FakeClient:
+    _url = "http://kanboard.test/jsonrpc.php"
+    _username = "jsonrpc"
+    _password = "token"
+
+
+def _response(body):
+    response = MagicMock()
+    response.content = json.dumps(body).encode()
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestBatchCall:
+    """Tests for batch_call."""
+
+    def test_empty_calls_skip_request(self):
+        """Should not send a request for an empty batch."""
+        with patch("lib.kanboard_rpc.requests.post") as post:
+            assert batch_call(FakeClient(), []) == []
+        post.assert_not_called()
+
+    def test_sends_single_batch_payload(self):
+        """Should send every call in one JSON array."""
+        body = [
+            {"jsonrpc": "2.0", "id": 1, "result": ["b"]},
+            {"jsonrpc": "2.0", "id": 0, "result": ["a"]},
+        ]
+        with patch("lib.kanboard_rpc.requests.post", return_value=_response(body)) as post:
+            results = batch_call(
+                FakeClient(),
+                [("getTaskTags", {"task_id": 1}), ("getTaskTags", {"task_id": 2})],
+            )
+
+        assert results == [["a"], ["b"]]
+        post.assert_called_once()
+        payload = json.loads(post.call_args.kwargs["data"])
+        assert [item["params"]["task_id"] for item in payload] == [1, 2]
+        expected = "Basic " + base64.b64encode(b"jsonrpc:token").decode()
+        assert post.call_args.kwargs["headers"]["Authorization"] == expected
+
+    def test_uses_client_auth_header(self):
+        """A client configured with X-API-Auth must not get basic auth on batches."""
+        kb = SessionClient(
+            "http://kanboard.test/jsonrpc.php", "jsonrpc", "token", auth_header="X-API-Auth"
+        )
+        body = [{"jsonrpc": "2.0", "id": 0, "result": []}]
+        with patch.object(kb.session, "post", return_value=_response(body)) as post:
+            batch_call(kb, [("getTaskTags", {"task_id": 1})])
+
+        headers = post.call_args.kwargs["headers"]
+        assert headers["X-API-Auth"] == base64.b64encode(b"jsonrpc:token").decode()
+        assert "Authorization" not in headers
+        assert "auth" not in post.call_args.kwargs
+
+    def test_per_call_errors_are_returned(self):
+        """Should return an error object for failed elements only."""
+        body = [
+            {"jsonrpc": "2.0", "id": 0, "result": True},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Method not found"}},
+        ]
+        with patch("lib.kanboard_rpc.requests.post", return_value=_response(body)):
+            results = batch_call(FakeClient(), [("a", {}), ("b", {})])
+
+        assert results[0] is True
+        assert isinstance(results[1], BatchCallError)
+        assert "Method not found" in str(results[1])
+
+    def test_splits_oversized_batches(self):
+        """Should send one request per max_batch_size calls, keeping order."""
+        def post(url, data, headers, timeout):
+            return _response([
+                {"jsonrpc": "2.0", "id": item["id"], "result": item["params"]["task_id"]}
+                for item in json.loads(data)
+            ])
+
+        calls = [("getTaskTags", {"task_id": tid}) for tid in range(5)]
+        with patch("lib.kanboard_rpc.requests.post", side_effect=post) as mock_post:
+            results = batch_call(FakeClient(), calls, max_batch_size=2)
+
+        assert results == [0, 1, 2, 3, 4]
+        assert mock_post.call_count == 3
+
+    def test_rejects_non_batch_response(self):
+        """Should raise when the server does not answer with an array."""
+        body = {"jsonrpc": "2.0", "id": None, "error": {"message": "Parse error"}}
+        with patch("lib.kanboard_rpc.requests.post", return_value=_response(body)):
+            with pytest.raises(ValueError):
+                batch_call(FakeClient(), [("a", {})])
+
+
+class TestSessionClient:
+    """Tests for the keep-alive Kanboard client."""
+
+    def test_reuses_one_session_across_calls(self):
+        """Every call should go through the same requests.Session."""
+        kb = SessionClient("http://kanboard.test/jsonrpc.php", "jsonrpc", "token")
+        body = {"jsonrpc": "2.0", "id": 1, "result": [{"id": 1}]}
+        response = MagicMock(content=json.dumps(body).encode())
+        with patch.object(kb.session, "post", return_value=response) as post:
+            assert kb.get_columns(project_id=1) == [{"id": 1}]
+            kb.get_all_tasks(project_id=1)
+
+        assert post.call_count == 2
+        assert json.loads(post.call_args.kwargs["data"])["method"] == "getAllTasks"
+
+    def test_rpc_errors_raise_client_error(self):
+        """JSON-RPC errors should keep kanboard.ClientError semantics."""
+        kb = SessionClient("http://kanboard.test/jsonrpc.php", "jsonrpc", "token")
+        body = {"jsonrpc": "2.0", "id": 1, "error": {"message": "Unauthorized"}}
+        response = MagicMock(content=json.dumps(body).encode())
+        with patch.object(kb.session, "post", return_value=response):
+            with pytest.raises(ClientError, match="Unauthorized"):
+                kb.get_task(task_id=1)
+
+    def test_calls_use_default_timeout(self):
+        """A stalled Kanboard must not hang the caller forever."""
+        kb = SessionClient("http://kanboard.test/jsonrpc.php", "jsonrpc", "token")
+        body = {"jsonrpc": "2.0", "id": 1, "result": True}
+        response = MagicMock(content=json.dumps(body).encode())
+        with patch.object(kb.session, "post", return_value=response) as post:
+            kb.get_task(task_id=1)
+
+        assert post.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+    def test_retries_connection_failures_only(self):
+        """The mounted adapter should retry connects but never re-send requests."""
+        kb = SessionClient("http://kanboard.test/jsonrpc.php", "jsonrpc", "token")
+        retries = kb.session.get_adapter("https://kanboard.test").max_retries
+        assert retries.connect == 3
+        assert retries.read == 0
+
+    def test_batch_call_uses_client_session(self):
+        """batch_call should reuse the client's session when it has one."""
+        kb = SessionClient("http://kanboard.test/jsonrpc.php", "jsonrpc", "token")
+        body = [{"jsonrpc": "2.0", "id": 0, "result": []}]
+        with patch.object(kb.session, "post", return_value=_response(body)) as post:
+            assert batch_call(kb, [("getTaskTags", {"task_id": 1})]) == [[]]
+        post.assert_called_once()
+
+
+class TestGetTaskTagsBulk:
+    """Tests for batched tag lookup."""
+
+    def test_maps_results_to_task_ids(self):
+        """Should normalize each result and key it by task ID."""
+        body = [
+            {"jsonrpc": "2.0", "id": 0, "result": {"7": "design-started"}},
+            {"jsonrpc": "2.0", "id": 1, "error": {"message": "boom"}},
+        ]
+        with patch("lib.kanboard_rpc.requests.post", return_value=_response(body)):
+            tags = get_task_tags_bulk(FakeClient(), [10, 11])
+
+        assert tags == {10: frozenset({"design-started"}), 11: frozenset()}
@@ -0,0 +1,612 @@
+"""Tests for orchestrator task routing and bookkeeping."""
+import dataclasses
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+
+import pytest
+
+import orchestrator
+from lib.kanboard_rpc import BatchCallError
+
+
+COLUMNS = [
+    {"id": "1", "title": "1. Inbox"},
+    {"id": "2", "title": "2. Design Draft"},
+    {"id": "9", "title": "9. Code Review"},
+]
+
+
+class FakeKanboard:
+    """In-memory stand-in for the Kanboard JSON-RPC client."""
+
+    def __init__(self, tags=None, tasks=None):
+        self.tags = {int(k): set(v) for k, v in (tags or {}).items()}
+        self.tasks = {int(task["id"]): task for task in (tasks or [])}
+        self.calls = []
+        self.comments = []
+        # method -> error returned for that call inside a batch
+        self.batch_errors = {}
+        # exception raised by the whole batch request
+        self.batch_exception = None
+
+    def get_columns(self, project_id):
+        return COLUMNS
+
+    def get_task(self, task_id):
+        return self.tasks.get(int(task_id))
+
+    def search_tasks(self, project_id, query):
+        return list(self.tasks.values())
+
+    def get_task_tags(self, task_id):
+        return dict(enumerate(sorted(self.tags.get(int(task_id), ()))))
+
+    def set_task_tags(self, project_id, task_id, tags):
+        self.execute("setTaskTags", project_id=project_id, task_id=task_id, tags=tags)
+
+    def create_comment(self, **params):
+        return self.execute("createComment", **params)
+
+    def execute(self, method, **params):
+        self.calls.append((method, params))
+        if method == "getTaskTags":
+            return self.get_task_tags(params["task_id"])
+        if method == "setTaskTags":
+            self.tags[int(params["task_id"])] = set(params["tags"])
+        elif method == "createComment":
+            self.comments.append(params["content"])
+        return True
+
+    def batch(self, calls):
+        if self.batch_exception is not None:
+            raise self.batch_exception
+        results = []
+        for method, params in calls:
+            if method in self.batch_errors:
+                results.append(BatchCallError(method, self.batch_errors[method]))
+            else:
+                results.append(self.execute(method, **params))
+        return results
+
+
+def _fake_batch_call(kb, calls, *args, **kwargs):
+    return kb.batch(calls)
+
+
+@pytest.fixture(autouse=True)
+def isolated_orchestrator(monkeypatch, tmp_path):
+    """Route batches to the fake client and reset module-level state."""
+    monkeypatch.setattr(orchestrator, "batch_call", _fake_batch_call)
+    monkeypatch.setattr("lib.kanboard_rpc.batch_call", _fake_batch_call)
+    monkeypatch.setattr(orchestrator, "CLAIMS_DIR", tmp_path / "claims")
+    monkeypatch.setattr(orchestrator, "SINGLE_CARD_MODE", False)
+    orchestrator._cached_column_maps.cache_clear()
+    orchestrator._cached_task_fields.cache_clear()
+    orchestrator._COMPLETED_SEEN.clear()
+    orchestrator._IN_FLIGHT.clear()
+    yield
+    orchestrator._cached_column_maps.cache_clear()
+    orchestrator._cached_task_fields.cache_clear()
+    orchestrator._COMPLETED_SEEN.clear()
+
+
+ARCHITECT_TAGS = orchestrator.TAGS["ARCHITECT_AGENT"]
+
+
+class TestCompleteAgentRun:
+    """Tests for batched success bookkeeping."""
+
+    def test_batch_sets_tags_status_and_comment(self):
+        """One batch should tag the card, update status and comment."""
+        kb = FakeKanboard(tags={5: {ARCHITECT_TAGS["started"], ARCHITECT_TAGS["failed"]}})
+        orchestrator._complete_agent_run(kb, 1, 5, ARCHITECT_TAGS, phase="design", comment="Done")
+
+        assert ARCHITECT_TAGS["completed"] in kb.tags[5]
+        assert ARCHITECT_TAGS["failed"] not in kb.tags[5]
+        assert kb.comments == ["Done"]
+        assert ("saveTaskMetadata", {"task_id": 5, "name": "agent_status", "value": "completed"}) in kb.calls
+
+    def test_rejected_tag_write_is_retried_individually(self):
+        """A setTaskTags rejected inside the batch must still land."""
+        kb = FakeKanboard(tags={5: set()})
+        kb.batch_errors["setTaskTags"] = {"message": "busy"}
+
+        orchestrator._complete_agent_run(kb, 1, 5, ARCHITECT_TAGS, comment="Done")
+
+        assert ARCHITECT_TAGS["completed"] in kb.tags[5]
+        assert kb.comments == ["Done"]
+
+    def test_failed_batch_request_does_not_repost_comment(self):
+        """The batch may have landed, so the comment must not be sent twice."""
+        kb = FakeKanboard(tags={5: set()})
+        kb.batch_exception = TimeoutError("read timed out")
+
+        orchestrator._complete_agent_run(kb, 1, 5, ARCHITECT_TAGS, phase="design", comment="Done")
+
+        assert ARCHITECT_TAGS["completed"] in kb.tags[5]
+        assert kb.comments == []
+        assert ("saveTaskMetadata", {"task_id": 5, "name": "current_phase", "value": "design"}) in kb.calls
+
+
+
+class RecordingRunner:
+    """Agent runner stub that records its keyword arguments."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.result
+
+
+def _spec(action, result):
+    """Return the real spec for ``action`` with its runner stubbed out."""
+    runner = RecordingRunner(result)
+    return dataclasses.replace(orchestrator._AGENT_SPECS[action], runner=runner), runner
+
+
+FIELDS = {"dirname": "demo", "context_mode": "FEATURE", "acceptance_criteria": "- works"}
+
+
+@pytest.fixture
+def task_fields(monkeypatch):
+    """Serve fixed task fields instead of reading Kanboard metadata."""
+    monkeypatch.setattr(orchestrator, "get_task_fields", lambda kb, task_id: dict(FIELDS))
+    return FIELDS
+
+
+class TestRunAgentTask:
+    """Tests for the table-driven agent runner."""
+
+    TASK = {"id": 5, "title": "Build it", "column_id": 2}
+
+    @pytest.mark.parametrize("state", ["completed", "started"])
+    def test_skips_completed_and_started_cards(self, state, task_fields):
+        """A card already done or in progress must not run the agent again."""
+        spec, runner = _spec("ARCHITECT_AGENT", {"success": True})
+        kb = FakeKanboard(tags={5: {ARCHITECT_TAGS[state]}})
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is False
+        assert runner.calls == []
+        assert kb.calls == []
+
+    @pytest.mark.parametrize("action,commented", [("PM_AGENT", True), ("TEST_AGENT", False)])
+    def test_field_error_comment_follows_spec(self, action, commented, monkeypatch):
+        """Only specs with comment_field_errors explain unreadable fields on the card."""
+        def broken_fields(kb, task_id):
+            raise orchestrator.TaskFieldError("dirname missing")
+
+        monkeypatch.setattr(orchestrator, "get_task_fields", broken_fields)
+        spec, runner = _spec(action, {"success": True})
+        kb = FakeKanboard(tags={5: set()})
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is False
+        assert runner.calls == []
+        if commented:
+            assert kb.comments == [f"**{action} Error**\n\ndirname missing"]
+        else:
+            assert kb.comments == []
+
+    def test_success_records_completion(self, task_fields):
+        """A successful run should leave only started+completed tags, status and comment."""
+        spec, runner = _spec("TEST_AGENT", {"success": True, "test_plan": "tests/TEST_PLAN.md"})
+        kb = FakeKanboard(tags={5: set()})
+        tags = orchestrator.TAGS["TEST_AGENT"]
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is True
+        assert kb.tags[5] == {tags["started"], tags["completed"]}
+        assert ("saveTaskMetadata", {"task_id": 5, "name": "agent_status", "value": "completed"}) in kb.calls
+        assert kb.comments == [
+            "**TEST_AGENT**: Created test plan `tests/TEST_PLAN.md`.\n\nReady for Human Review."
+        ]
+
+    def test_failure_posts_heading_and_unblocks_retry(self, task_fields):
+        """A failed run should swap started for failed and explain the error."""
+        spec, _ = _spec("RALPH_CODER", {"success": False, "error": "tests red"})
+        kb = FakeKanboard(tags={5: set()})
+        tags = orchestrator.TAGS["RALPH_CODER"]
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is False
+        assert kb.tags[5] == {tags["failed"]}
+        assert ("saveTaskMetadata", {"task_id": 5, "name": "agent_status", "value": "failed"}) in kb.calls
+        assert kb.comments == ["**RALPH Failed**\n\ntests red"]
+
+    def test_failure_without_heading_posts_no_comment(self, task_fields):
+        """Specs without a failure heading only tag the failure."""
+        spec, _ = _spec("ARCHITECT_AGENT", {"success": False, "error": "boom"})
+        kb = FakeKanboard(tags={5: set()})
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is False
+        assert kb.tags[5] == {ARCHITECT_TAGS["failed"]}
+        assert kb.comments == []
+
+    @pytest.mark.parametrize("action,forwarded", [("ARCHITECT_AGENT", True), ("TEST_AGENT", False)])
+    def test_needs_context_forwards_task_fields(self, action, forwarded, task_fields):
+        """context_mode/acceptance_criteria reach only agents that need them."""
+        spec, runner = _spec(action, {"success": True})
+        kb = FakeKanboard(tags={5: set()})
+
+        orchestrator._run_agent_task(kb, self.TASK, 1, spec)
+
+        (kwargs,) = runner.calls
+        assert kwargs["task_id"] == "5"
+        assert kwargs["dirname"] == "demo"
+        assert kwargs["kb_client"] is kb
+        if forwarded:
+            assert kwargs["context_mode"] == "FEATURE"
+            assert kwargs["acceptance_criteria"] == "- works"
+        else:
+            assert "context_mode" not in kwargs
+            assert "acceptance_criteria" not in kwargs
+
+
+class TestCodeReviewSpec:
+    """Tests for the code review prerequisite tag and result gate."""
+
+    TASK = {"id": 7, "title": "Review it", "column_id": 9}
+    TAGS = orchestrator.TAGS["CODE_REVIEW_AGENT"]
+    CODING_DONE = orchestrator.TAGS["RALPH_CODER"]["completed"]
+
+    def test_card_without_coding_complete_is_skipped(self, task_fields):
+        """Review must not run before the Ralph loop has completed."""
+        spec, runner = _spec("CODE_REVIEW_AGENT", {"success": True, "gate_passed": True})
+        kb = FakeKanboard(tags={7: set()})
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is False
+        assert runner.calls == []
+        assert kb.tags[7] == {self.TAGS["failed"]}
+        assert kb.comments == [spec.missing_requirement_comment]
+
+    def test_failed_gate_is_recorded_as_failure(self, task_fields):
+        """A review that runs but fails its gate must not be marked completed."""
+        spec, runner = _spec("CODE_REVIEW_AGENT", {"success": True, "gate_passed": False})
+        kb = FakeKanboard(tags={7: {self.CODING_DONE}})
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is False
+        assert len(runner.calls) == 1
+        assert self.TAGS["completed"] not in kb.tags[7]
+        assert kb.tags[7] == {self.CODING_DONE, self.TAGS["failed"]}
+        assert kb.comments == [spec.gate_failed_comment]
+
+    def test_passed_gate_completes_review(self, task_fields):
+        """With the prerequisite tag and a passing gate the review completes."""
+        spec, _ = _spec(
+            "CODE_REVIEW_AGENT",
+            {"success": True, "gate_passed": True, "overall_status": "PASS", "finding_count": 0},
+        )
+        kb = FakeKanboard(tags={7: {self.CODING_DONE}})
+
+        assert orchestrator._run_agent_task(kb, self.TASK, 1, spec) is True
+        assert self.TAGS["completed"] in kb.tags[7]
+        assert self.TAGS["failed"] not in kb.tags[7]
+
+
+class ImmediateExecutor:
+    """Executor stand-in that runs submitted work synchronously."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted.append(args)
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class RecordingLog:
+    """Logger stand-in that keeps error messages."""
+
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message, **fields):
+        self.errors.append((message, fields))
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestSubmitTask:
+    """Tests for worker-pool submission and in-flight dedupe."""
+
+    def test_in_flight_card_is_not_submitted_twice(self, monkeypatch):
+        """A card still running must not be handed to a second worker."""
+        release = threading.Event()
+        monkeypatch.setattr(orchestrator, "process_task", lambda *args, **kwargs: release.wait(5))
+        task = {"id": 5, "title": "Build it", "column_id": "2"}
+
+        first = orchestrator._submit_task(FakeKanboard(), task, "ARCHITECT_AGENT", 1, None)
+        try:
+            assert first is not None
+            assert orchestrator._submit_task(FakeKanboard(), task, "ARCHITECT_AGENT", 1, None) is None
+        finally:
+            release.set()
+        assert first.result(timeout=5) is True
+
+    def test_finished_card_can_be_submitted_again(self, monkeypatch):
+        """The in-flight mark is released once the worker is done."""
+        executor = ImmediateExecutor()
+        monkeypatch.setattr(orchestrator, "EXECUTOR", executor)
+        monkeypatch.setattr(orchestrator, "process_task", lambda *args, **kwargs: True)
+        task = {"id": 5, "title": "Build it", "column_id": "2"}
+
+        orchestrator._submit_task(FakeKanboard(), task, "ARCHITECT_AGENT", 1, None)
+        orchestrator._submit_task(FakeKanboard(), task, "ARCHITECT_AGENT", 1, None)
+
+        assert len(executor.submitted) == 2
+        assert orchestrator._IN_FLIGHT == set()
+
+    def test_worker_exception_is_logged(self, monkeypatch):
+        """Errors surface in the log even when nobody reads the future."""
+        def explode(*args, **kwargs):
+            raise RuntimeError("agent crashed")
+
+        recording = RecordingLog()
+        monkeypatch.setattr(orchestrator, "log", recording)
+        monkeypatch.setattr(orchestrator, "EXECUTOR", ImmediateExecutor())
+        monkeypatch.setattr(orchestrator, "process_task", explode)
+
+        orchestrator._submit_task(FakeKanboard(), {"id": 5}, "ARCHITECT_AGENT", 1, None)
+
+        assert recording.errors == [("Task processing error: agent crashed", {"task_id": 5})]
+        assert orchestrator._IN_FLIGHT == set()
+
+
+class TestHandleWebhookEvent:
+    """Tests for webhook payload parsing and column routing."""
+
+    @pytest.fixture
+    def submitted(self, monkeypatch):
+        """Record dispatches instead of running agents."""
+        calls = []
+        monkeypatch.setattr(
+            orchestrator,
+            "_submit_task",
+            lambda kb, task, action, project_id, work_package_dir: calls.append((task, action)),
+        )
+        return calls
+
+    @staticmethod
+    def _move(task_id=5, dst_column_id=2, task=None):
+        event_data = {"task_id": task_id, "dst_column_id": dst_column_id}
+        if task is not None:
+            event_data["task"] = task
+        return {"event_name": "task.move.column", "event_data": event_data}
+
+    def test_embedded_task_uses_destination_column(self, submitted):
+        """The embedded task is used as-is, moved to dst_column_id with Kanboard's id type."""
+        # No tasks on the fake board: dispatching proves getTask was not needed
+        kb = FakeKanboard(tags={5: set()})
+        embedded = {"id": "5", "title": "Build it", "column_id": "1", "project_id": "1"}
+
+        orchestrator._handle_webhook_event(kb, 1, self._move(task=embedded))
+
+        ((task, action),) = submitted
+        assert action == "ARCHITECT_AGENT"
+        assert task["column_id"] == "2"
+        assert embedded["column_id"] == "1"
+
+    def test_missing_embedded_task_is_fetched(self, submitted):
+        """Without an embedded task the card is read from Kanboard."""
+        kb = FakeKanboard(
+            tags={5: set()},
+            tasks=[{"id": "5", "title": "Review it", "column_id": "9", "project_id": "1"}],
+        )
+
+        orchestrator._handle_webhook_event(kb, 1, self._move(dst_column_id=9))
+
+        assert [action for _, action in submitted] == ["CODE_REVIEW_AGENT"]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"event_name": "task.update", "event_data": {"task_id": 5}},
+            {"event_name": "task.move.column", "event_data": {}},
+            {"event_name": "task.move.column"},
+        ],
+    )
+    def test_unhandled_or_incomplete_events_are_ignored(self, data, submitted):
+        """Other events and payloads without a task id dispatch nothing."""
+        orchestrator._handle_webhook_event(FakeKanboard(), 1, data)
+        assert submitted == []
+
+    def test_non_trigger_column_is_not_dispatched(self, submitted):
+        """Moving a card into a column without an agent does nothing."""
+        kb = FakeKanboard(tags={5: set()})
+        embedded = {"id": "5", "title": "Build it", "column_id": "2", "project_id": "1"}
+
+        orchestrator._handle_webhook_event(kb, 1, self._move(dst_column_id=1, task=embedded))
+
+        assert submitted == []
+
+    def test_other_project_is_ignored(self, submitted):
+        """Events for another board's cards are not dispatched."""
+        kb = FakeKanboard(tags={5: set()})
+        embedded = {"id": "5", "title": "Build it", "column_id": "2", "project_id": "3"}
+
+        orchestrator._handle_webhook_event(kb, 1, self._move(task=embedded))
+
+        assert submitted == []
+
+    def test_completed_card_is_not_dispatched(self, submitted):
+        """A card already done for the column's agent is skipped."""
+        kb = FakeKanboard(tags={5: {ARCHITECT_TAGS["completed"]}})
+        embedded = {"id": "5", "title": "Build it", "column_id": "2", "project_id": "1"}
+
+        orchestrator._handle_webhook_event(kb, 1, self._move(task=embedded))
+
+        assert submitted == []
+
+
+class TestWebhookListener:
+    """Tests for the webhook HTTP listener."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        """Run a listener on a free localhost port, recording handled events."""
+        events = []
+        handled = threading.Event()
+
+        def record(kb, project_id, data):
+            events.append(data)
+            handled.set()
+
+        monkeypatch.setattr(orchestrator, "_handle_webhook_event", record)
+        monkeypatch.setattr(orchestrator, "WEBHOOK_TOKEN", "s3cret")
+        server = orchestrator.start_webhook_listener(FakeKanboard(), 1, 0)
+        server.events = events
+        server.handled = handled
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def _post(server, query=""):
+        url = f"http://127.0.0.1:{server.server_port}/{query}"
+        body = json.dumps({"event_name": "task.create", "event_data": {"task_id": 5}}).encode()
+        request = urllib.request.Request(url, data=body, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def test_binds_localhost_by_default(self, server):
+        """The listener is not exposed on every interface unless asked."""
+        assert server.server_address[0] == "127.0.0.1"
+
+    def test_matching_token_is_accepted(self, server):
+        """A request with the configured token is handed to the dispatcher."""
+        assert self._post(server, "?token=s3cret") == 202
+        assert server.handled.wait(5)
+        assert server.events == [{"event_name": "task.create", "event_data": {"task_id": 5}}]
+
+    @pytest.mark.parametrize("query", ["", "?token=wrong", "?token=s3cre"])
+    def test_missing_or_wrong_token_is_rejected(self, server, query):
+        """Requests without the configured token never reach the dispatcher."""
+        assert self._post(server, query) == 403
+        assert server.events == []
+
+
+class FakeWakeEvent:
+    """Stand-in for _WAKE_EVENT that records waits instead of sleeping."""
+
+    def __init__(self, woken=()):
+        self.waits = []
+        self.woken = list(woken)
+        self.cleared = 0
+
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        return self.woken.pop(0) if self.woken else False
+
+    def clear(self):
+        self.cleared += 1
+
+
+class TestRunPolling:
+    """Tests for the drain/backoff scheduling of the polling loop."""
+
+    @pytest.fixture
+    def polling(self, monkeypatch):
+        """Script _poll_once results; the loop stops once the script runs out."""
+        monkeypatch.setattr(orchestrator, "_install_wake_handler", lambda: None)
+        monkeypatch.setattr(orchestrator.random, "uniform", lambda a, b: 0)
+
+        def run(results, wake_event=None, **kwargs):
+            results = list(results)
+            polls = []
+
+            def poll_once(kb, project_id):
+                polls.append(time.monotonic())
+                if not results:
+                    raise KeyboardInterrupt
+                return results.pop(0)
+
+            monkeypatch.setattr(orchestrator, "_poll_once", poll_once)
+            if wake_event is not None:
+                monkeypatch.setattr(orchestrator, "_WAKE_EVENT", wake_event)
+            orchestrator.run_polling(FakeKanboard(), **kwargs)
+            return polls
+
+        return run
+
+    def test_idle_pass_waits_before_polling_again(self, polling):
+        """Once a pass processes nothing the loop sleeps instead of re-polling."""
+        event = FakeWakeEvent()
+        polls = polling([2, 1, 0], event, poll_interval=5, idle_interval=60)
+
+        assert len(polls) == 4
+        assert event.waits == [1, 1, 10]
+
+    def test_busy_handler_cannot_spin(self, polling):
+        """Passes that always report work are still spaced by DRAIN_INTERVAL."""
+        event = FakeWakeEvent()
+        polling([1] * 5, event, poll_interval=5, idle_interval=60)
+
+        assert event.waits == [orchestrator.DRAIN_INTERVAL] * 5
+
+    def test_idle_delay_doubles_up_to_cap(self, polling):
+        """Consecutive idle passes back off exponentially to idle_interval."""
+        event = FakeWakeEvent()
+        polling([0] * 6, event, poll_interval=5, idle_interval=60)
+
+        assert event.waits == [10, 20, 40, 60, 60, 60]
+
+    def test_work_resets_the_backoff(self, polling):
+        """Finding work again returns the idle delay to poll_interval."""
+        event = FakeWakeEvent()
+        polling([0, 0, 0, 1, 0], event, poll_interval=5, idle_interval=60)
+
+        assert event.waits == [10, 20, 40, 1, 10]
+
+    def test_wake_up_resets_the_backoff(self, polling):
+        """A wake-up polls at once and restarts the backoff from poll_interval."""
+        event = FakeWakeEvent(woken=[False, False, True])
+        polling([0, 0, 0, 0], event, poll_interval=5, idle_interval=60)
+
+        assert event.waits == [10, 20, 40, 10]
+        assert event.cleared == 1
+
+    def test_wake_event_cuts_a_real_wait_short(self, polling):
+        """Setting _WAKE_EVENT during a long idle wait triggers the next poll promptly."""
+        event = threading.Event()
+        timer = threading.Timer(0.1, event.set)
+        timer.start()
+        try:
+            started = time.monotonic()
+            polls = polling([0], event, poll_interval=30, idle_interval=60)
+        finally:
+            timer.cancel()
+
+        assert len(polls) == 2
+        assert polls[1] - started < 5
+        assert not event.is_set()
+
+
+class TestIterPendingTasks:
+    """Tests for selecting cards that still need an agent run."""
+
+    def test_single_card_mode_skips_unknown_column(self, monkeypatch):
+        """A card in a column missing from the cached map is skipped, not a KeyError."""
+        monkeypatch.setattr(orchestrator, "SINGLE_CARD_MODE", True)
+        monkeypatch.setattr(
+            orchestrator, "_sync_single_card_state",
+            lambda *args: pytest.fail("card in an unknown column was synced"),
+        )
+        kb = FakeKanboard(tags={5: set()})
+        task = {"id": "5", "title": "Build it", "column_id": "2"}
+        # The trigger map knows column 2, the stale id -> name map does not
+        stale_names = {"1": "1. Inbox"}
+
+        assert list(orchestrator._iter_pending_tasks(kb, 1, [task], stale_names)) == []
@@ -4,6 +4,9 @@ from lib.task_fields import (
     parse_yaml_description,
     validate_task_fields,
     has_tag,
+    add_task_tag,
+    get_task_tags_bulk,
+    status_calls,
 )
 
 
@@ -137,3 +140,86 @@ class TestHasTag:
     def test_empty_list(self):
         """Should return False for empty list."""
         assert not has_tag([], "foo")
+
+    def test_frozenset(self):
+        """Should accept the frozenset returned by get_task_tags."""
+        assert has_tag(frozenset({"foo"}), "foo")
+
+
+class TestAddTaskTag:
+    """Tests for add_task_tag."""
+
+    class FakeClient:
+        def __init__(self, tags):
+            self.tags = tags
+            self.fetches = 0
+            self.saved = None
+
+        def get_task_tags(self, task_id):
+            self.fetches += 1
+            return dict(enumerate(self.tags))
+
+        def set_task_tags(self, project_id, task_id, tags):
+            self.saved = tags
+
+    def test_fetches_tags_when_unknown(self):
+        """Should read current tags before writing."""
+        kb = self.FakeClient(["a"])
+        assert add_task_tag(kb, 1, 2, "b") == frozenset({"a", "b"})
+        assert kb.fetches == 1
+        assert kb.saved == ["a", "b"]
+
+    def test_known_tags_skip_fetch(self):
+        """Should trust known_tags instead of re-reading them."""
+        kb = self.FakeClient(["a"])
+        assert add_task_tag(kb, 1, 2, "b", known_tags=frozenset({"a"})) == frozenset({"a", "b"})
+        assert kb.fetches == 0
+
+    def test_present_tag_is_not_rewritten(self):
+        """Should not write when the tag is already there."""
+        kb = self.FakeClient([])
+        assert add_task_tag(kb, 1, 2, "a", known_tags=frozenset({"a"})) == frozenset({"a"})
+        assert kb.saved is None
+
+
+class TestStatusCalls:
+    """Tests for batchable status updates."""
+
+    def test_builds_one_call_per_status_field(self):
+        """Should emit a saveTaskMetadata call for each valid field."""
+        calls = status_calls(5, agent_status="completed", current_phase="tests", other="x")
+        assert calls == [
+            ("saveTaskMetadata", {"task_id": 5, "name": "agent_status", "value": "completed"}),
+            ("saveTaskMetadata", {"task_id": 5, "name": "current_phase", "value": "tests"}),
+        ]
+
+    def test_no_valid_fields(self):
+        """Should return no calls when nothing is a status field."""
+        assert status_calls(5, dirname="x") == []
+
+
+class TestGetTaskTagsBulk:
+    """Tests for batched tag fetching."""
+
+    def test_empty_ids_returns_empty_dict(self):
+        """Should not touch the client when there is nothing to fetch."""
+        assert get_task_tags_bulk(object(), []) == {}
+
+    def test_falls_back_to_per_task_calls(self, monkeypatch):
+        """Should fetch tags one task at a time when batching fails."""
+        import sys
+        import types
+
+        class FakeClient:
+            def get_task_tags(self, task_id):
+                return {"1": f"tag-{task_id}"}
+
+        def failing_batch(kb_client, calls):
+            raise RuntimeError("batch unavailable")
+
+        fake_rpc = types.ModuleType("lib.kanboard_rpc")
+        fake_rpc.batch_call = failing_batch
+        monkeypatch.setitem(sys.modules, "lib.kanboard_rpc", fake_rpc)
+
+        tags = get_task_tags_bulk(FakeClient(), [3, "4"])
+        assert tags == {3: frozenset({"tag-3"}), 4: frozenset({"tag-4"})}
@@ -45,6 +45,11 @@ class TestSafeWriteFile:
         safe_write_file(workspace, "src/module/test.py", "# nested")
         assert (workspace / "src" / "module" / "test.py").exists()
 
+    def test_writes_utf8_content(self, workspace):
+        """Should write non-ASCII content as UTF-8."""
+        safe_write_file(workspace, "notes.md", "café ✓\n" * 1000)
+        assert (workspace / "notes.md").read_text(encoding="utf-8") == "café ✓\n" * 1000
+
     def test_overwrites_unlocked_file(self, workspace):
         """Should overwrite files that aren't locked."""
         safe_write_file(workspace, "test.py", "# original")
@@ -115,3 +120,7 @@ class TestValidateDirname:
     def test_invalid_underscores(self):
         """Underscores should be invalid (per regex)."""
         assert not validate_dirname("my_project")
+
+    def test_invalid_trailing_newline(self):
+        """A trailing newline should be invalid."""
+        assert not validate_dirname("my-project\n")
@@ -20,8 +20,16 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Any, cast
 
 from dotenv import load_dotenv
-from kanboard import Client
 
+from agents.architect import run_architect_agent
+from agents.code_review import run_code_review_agent
+from agents.governance import run_governance_agent
+from agents.pm import run_pm_agent
+from agents.ralph import run_ralph_agent
+from agents.spawner import run_spawner_agent
+from agents.test_agent import run_test_agent
+from agents.test_code_agent import run_test_code_agent
+from lib.kanboard_rpc import SessionClient
 from lib.task_fields import get_task_fields, update_status, TaskFieldError, get_task_tags, add_task_tag, has_tag
 
 load_dotenv()
@@ -130,7 +138,7 @@ def get_kb_client() -> Any:
     if not KB_TOKEN:
         raise RuntimeError("KANBOARD_TOKEN not set")
     token = cast(str, KB_TOKEN)
-    return Client(KB_URL, KB_USER, token)
+    return SessionClient(KB_URL, KB_USER, token)
 
 
 def _normalize_column_title(column_title: str) -> str:
@@ -198,8 +206,6 @@ def _mark_agent_succeeded(kb, project_id: int, task_id: int, agent_tags: dict[st
 
 def process_architect_task(kb, task_id: int, project_id: int):
     """Process a task in the Design Draft column."""
-    from agents.architect import run_architect_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         print(f"  Error: Task #{task_id} not found")
@@ -256,8 +262,6 @@ def process_architect_task(kb, task_id: int, project_id: int):
 
 def process_governance_task(kb, task_id: int, project_id: int):
     """Process a task in an Approved column (Locking)."""
-    from agents.governance import run_governance_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         return
@@ -304,8 +308,6 @@ def process_governance_task(kb, task_id: int, project_id: int):
 
 def process_pm_task(kb, task_id: int, project_id: int):
     """Process a task in the Planning Draft column."""
-    from agents.pm import run_pm_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         return
@@ -362,8 +364,6 @@ def process_pm_task(kb, task_id: int, project_id: int):
 
 def process_spawner_task(kb, task_id: int, project_id: int):
     """Process a task in the Plan Approved column (Fan-Out)."""
-    from agents.spawner import run_spawner_agent
-
     # Enforce Governance first
     tags = get_task_tags(kb, task_id)
     _clear_stale_started(kb, project_id, task_id, TAGS["SPAWNER_AGENT"])
@@ -419,8 +419,6 @@ def process_spawner_task(kb, task_id: int, project_id: int):
 
 def process_test_task(kb, task_id: int, project_id: int):
     """Process a task in the Tests Draft column."""
-    from agents.test_agent import run_test_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         return
@@ -473,8 +471,6 @@ def process_test_task(kb, task_id: int, project_id: int):
 
 def process_test_code_task(kb, task_id: int, project_id: int):
     """Process a task in the Tests Approved column (Code Generation)."""
-    from agents.test_code_agent import run_test_code_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         return
@@ -559,8 +555,6 @@ def process_test_code_task(kb, task_id: int, project_id: int):
 
 def process_ralph_task(kb, task_id: int, project_id: int):
     """Process a task in the Ralph Loop column."""
-    from agents.ralph import run_ralph_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         return
@@ -613,8 +607,6 @@ def process_ralph_task(kb, task_id: int, project_id: int):
 
 def process_code_review_task(kb, task_id: int, project_id: int):
     """Process a task in the Code Review column."""
-    from agents.code_review import run_code_review_agent
-
     task = cast(dict, kb.get_task(task_id=task_id))
     if not task:
         return
@@ -677,26 +669,26 @@ def process_code_review_task(kb, task_id: int, project_id: int):
         kb.create_comment(task_id=task_id, content=f"**CODE_REVIEW_AGENT Failed**\n\n{result['error']}")
 
 
+# Trigger action -> task processor
+_DISPATCH = {
+    "ARCHITECT_AGENT": process_architect_task,
+    "GOVERNANCE_AGENT": process_governance_task,
+    "PM_AGENT": process_pm_task,
+    "SPAWNER_AGENT": process_spawner_task,
+    "TEST_AGENT": process_test_task,
+    "TEST_CODE_AGENT": process_test_code_task,
+    "RALPH_CODER": process_ralph_task,
+    "CODE_REVIEW_AGENT": process_code_review_task,
+}
+
+
 def process_task(kb, task_id: int, project_id: int, action: str):
     """Route task to appropriate agent based on column."""
     print(f"  Triggering {action}...")
 
-    if action == "ARCHITECT_AGENT":
-        process_architect_task(kb, task_id, project_id)
-    elif action == "GOVERNANCE_AGENT":
-        process_governance_task(kb, task_id, project_id)
-    elif action == "PM_AGENT":
-        process_pm_task(kb, task_id, project_id)
-    elif action == "SPAWNER_AGENT":
-        process_spawner_task(kb, task_id, project_id)
-    elif action == "TEST_AGENT":
-        process_test_task(kb, task_id, project_id)
-    elif action == "TEST_CODE_AGENT":
-        process_test_code_task(kb, task_id, project_id)
-    elif action == "RALPH_CODER":
-        process_ralph_task(kb, task_id, project_id)
-    elif action == "CODE_REVIEW_AGENT":
-        process_code_review_task(kb, task_id, project_id)
+    handler = _DISPATCH.get(action)
+    if handler:
+        handler(kb, task_id, project_id)
 
 
 # --- HTTP HANDLER ---